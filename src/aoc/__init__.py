@@ -1,2 +1,3 @@
 """Advent of Code 2022."""
 VERSION = "0.0.1"
+__version__ = VERSION
@@ -1,29 +1,182 @@
 """CLI to solve Advent of Code 2022 challenges."""
+import cProfile
 import importlib
+import json
 import logging
+import pkgutil
+import pstats
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import click
+import click_pathlib
 import coloredlogs
-from click import Group
-from setuptools import find_packages
+
+from .bench import benchmark, compare
+from .runner import find_inputs, run_solver
 
 logger = logging.getLogger(__name__)
 coloredlogs.install(level="INFO")
 
 
-def add_solvers(base_cli: Group) -> None:
-    """Dynamically add groups to main CLI."""
-    solutions = [p for p in find_packages(str(Path(__file__).parent)) if "day" in p]
+class LazyGroup(click.Group):
+    """Click group that only imports a solver once its command is requested."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize group with an empty registry of lazy commands."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly and lazily registered commands."""
+        return sorted(super().list_commands(ctx) + list(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Import the module of a lazy command on first use."""
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            cli = importlib.import_module(self.lazy_commands[cmd_name])
+            self.add_command(cli.main, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
-    for solution in solutions:
-        cli = importlib.import_module(f"{__package__}.{solution}.solve")
-        base_cli.add_command(cli.main)
+def add_solvers(base_cli: LazyGroup) -> None:
+    """Register solvers on main CLI without importing them."""
+    for module in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module.ispkg and module.name.startswith("day"):
+            base_cli.lazy_commands[module.name] = f"{__package__}.{module.name}.solve"
 
 
-@click.group()
-def main() -> None:
+def _write_profile(profiler: cProfile.Profile, path: Path, top: int) -> None:
+    """Stop profiling, store the statistics and show the hotspots on stderr."""
+    profiler.disable()
+    profiler.dump_stats(path)
+
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats("tottime").print_stats(top)
+    logger.info("Profile written to %s", path)
+
+
+@click.group(cls=LazyGroup)
+@click.option(
+    "--profile",
+    type=click_pathlib.Path(dir_okay=False),
+    help="Profile the command and write cProfile data to this file.",
+)
+@click.option("--profile-top", type=int, default=20, help="Number of hotspots to show.")
+@click.pass_context
+def main(ctx: click.Context, profile: Path | None, profile_top: int) -> None:
     """Program to solve Advent of Code 2022 challenges."""
+    if profile:
+        profiler = cProfile.Profile()
+        ctx.call_on_close(partial(_write_profile, profiler, profile, profile_top))
+        profiler.enable()
+
+
+@main.command(name="run-all")
+@click.option(
+    "--path",
+    type=click_pathlib.Path(exists=True, file_okay=False),
+    required=True,
+    help="Directory with one input per day, e.g. day01.txt.",
+)
+@click.option(
+    "--workers", type=click.IntRange(min=1), default=None, help="Number of processes."
+)
+@click.option("--no-cache", is_flag=True, help="Do not use cached results.")
+def run_all(path: Path, workers: int | None, no_cache: bool) -> None:
+    """Solve all days in parallel."""
+    inputs = find_inputs(sorted(main.lazy_commands), path)
+    if not inputs:
+        raise click.UsageError(f"No inputs found in {path}.")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                partial(run_solver, no_cache=no_cache), inputs.keys(), inputs.values()
+            )
+        )
+    wall_time = time.perf_counter() - start
+
+    click.echo(f"{'Day':<6} {'Time (s)':>9}  Answers")
+    for day, lines, seconds in results:
+        for index, line in enumerate(lines or [""]):
+            prefix = f"{day:<6} {seconds:>9.4f}" if index == 0 else " " * 16
+            click.echo(f"{prefix}  {line}")
+    click.echo(f"{'Total':<6} {wall_time:>9.4f}")
+
+
+@main.command(name="bench")
+@click.option(
+    "--path",
+    type=click_pathlib.Path(exists=True, file_okay=False),
+    required=True,
+    help="Directory with one input per day, e.g. day01.txt.",
+)
+@click.option("--day", "days", multiple=True, help="Only benchmark these days.")
+@click.option(
+    "--repeat", type=click.IntRange(min=1), default=10, help="Number of runs per day."
+)
+@click.option(
+    "--output",
+    type=click_pathlib.Path(dir_okay=False),
+    help="Write results to a JSON file.",
+)
+@click.option(
+    "--baseline",
+    type=click_pathlib.Path(exists=True, dir_okay=False),
+    help="JSON file with earlier results to compare against.",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    help="Allowed relative slowdown of the median compared to the baseline.",
+)
+@click.pass_context
+# pylint: disable=too-many-arguments
+def bench(
+    ctx: click.Context,
+    path: Path,
+    days: tuple[str, ...],
+    repeat: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+) -> None:
+    """Benchmark solvers."""
+    if unknown := set(days) - set(main.lazy_commands):
+        raise click.UsageError(f"Unknown days: {', '.join(sorted(unknown))}.")
+
+    inputs = find_inputs(list(days) or sorted(main.lazy_commands), path)
+    if not inputs:
+        raise click.UsageError(f"No inputs found in {path}.")
+
+    results = {day: benchmark(day, inputs[day], repeat) for day in inputs}
+
+    click.echo(
+        f"{'Day':<6} {'Phase':<9} {'Min (s)':>10} {'Median (s)':>10} {'P95 (s)':>10}"
+    )
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            click.echo(
+                f"{day:<6} {phase:<9} {stats['min']:>10.6f} "
+                f"{stats['median']:>10.6f} {stats['p95']:>10.6f}"
+            )
+
+    if output:
+        output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if baseline:
+        regressions = compare(
+            results, json.loads(baseline.read_text(encoding="utf-8")), tolerance
+        )
+        for regression in regressions:
+            logger.warning("Regression in %s", regression)
+        if regressions:
+            ctx.exit(1)
 
 
 add_solvers(main)
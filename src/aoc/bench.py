@@ -0,0 +1,60 @@
+"""Benchmark the parse, part one and part two phases of solvers."""
+import math
+import statistics
+from pathlib import Path
+
+from .cli import get_solver
+from .inputs import open_input
+
+PHASES = ("parse", "part_one", "part_two")
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Determine a percentile of samples with the nearest-rank method."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def benchmark(day: str, path: Path, repeat: int) -> dict[str, dict[str, float]]:
+    """Run each phase of a solver a number of times and summarize timings.
+
+    The input is opened anew for every run, in the same way as the command of the
+    day reads it, so that streaming and memory-mapped inputs are timed as well.
+    """
+    solver = get_solver(day)
+    timings: dict[str, list[float]] = {phase: [] for phase in PHASES}
+
+    for _ in range(repeat):
+        with open_input(path, solver.mode) as data:
+            result = solver.solve(data)
+        for phase, seconds in result.timings.items():
+            timings.setdefault(phase, []).append(seconds)
+
+    return {
+        phase: {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "p95": _percentile(samples, 0.95),
+        }
+        for phase, samples in timings.items()
+    }
+
+
+def compare(
+    results: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    tolerance: float,
+) -> list[str]:
+    """Find phases of which the median is slower than the baseline allows."""
+    regressions: list[str] = []
+
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            reference = baseline.get(day, {}).get(phase)
+            if reference and stats["median"] > reference["median"] * (1 + tolerance):
+                regressions.append(
+                    f"{day} {phase}: median {stats['median']:.6f}s "
+                    f"vs. baseline {reference['median']:.6f}s"
+                )
+
+    return regressions
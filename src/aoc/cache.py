@@ -0,0 +1,79 @@
+"""On-disk cache of solver results."""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc"))
+MAX_CACHE_SIZE = 16 * 1024 * 1024
+CHUNK_SIZE = 1 << 20
+
+
+class ResultCache:
+    """Cache of results, evicting the least recently used entries first."""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_size: int = MAX_CACHE_SIZE):
+        """Initialize cache in a directory with a maximum total size in bytes."""
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def key(day: str, path: Path, options: dict[str, Any] | None = None) -> str:
+        """Determine cache key of a day given an input file and solver options."""
+        digest = hashlib.sha256(
+            f"{__version__}:{day}:{json.dumps(options or {}, sort_keys=True)}:".encode()
+        )
+
+        with path.open("rb") as handle:
+            while chunk := handle.read(CHUNK_SIZE):
+                digest.update(chunk)
+
+        return f"{day}-{digest.hexdigest()}"
+
+    def get(self, key: str) -> str | None:
+        """Get a cached result and mark it as recently used."""
+        entry = self.directory / key
+
+        try:
+            result = entry.read_text(encoding="utf-8")
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        return result
+
+    def put(self, key: str, result: str) -> None:
+        """Store a result and evict old entries when the cache is too large."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+        ) as handle:
+            handle.write(result)
+        os.replace(handle.name, self.directory / key)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size.
+
+        Temporary files are skipped, as they may still be written by other processes.
+        """
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.suffix == ".tmp":
+                continue
+            try:
+                entries.append((entry.stat(), entry))
+            except FileNotFoundError:
+                continue
+
+        total_size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda x: x[0].st_mtime):
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= stat.st_size
@@ -0,0 +1,158 @@
+"""Shared building blocks of the commands that solve a single day."""
+import contextlib
+import functools
+import glob
+import importlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Sequence
+
+import click
+from pydantic import ValidationError
+
+from .cache import ResultCache
+from .inputs import InputMode, open_input
+from .result import Result
+
+Solve = Callable[..., Result]
+Show = Callable[[Result], list[str]]
+
+
+class Solver(NamedTuple):
+    """Functions to solve a day and format its answers, and how its input is read."""
+
+    solve: Solve
+    show: Show
+    mode: InputMode
+
+
+_solvers: dict[str, Solver] = {}
+
+
+def expand_paths(patterns: tuple[str, ...]) -> list[Path]:
+    """Expand files, directories and glob patterns into a list of input files."""
+    paths: list[Path] = []
+
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            found = sorted(p for p in path.iterdir() if p.is_file())
+        elif path.is_file():
+            found = [path]
+        else:
+            found = [Path(m) for m in sorted(glob.glob(pattern)) if Path(m).is_file()]
+
+        if not found:
+            raise click.BadParameter(f"No input files match {pattern}.")
+        paths.extend(found)
+
+    return paths
+
+
+def get_solver(day: str) -> Solver:
+    """Import the module of a day and get its registered solver."""
+    importlib.import_module(f"{__package__}.{day}.solve")
+    return _solvers[day]
+
+
+def solve_file(
+    day: str,
+    path: Path,
+    no_cache: bool = False,
+    options: dict[str, Any] | None = None,
+) -> Result:
+    """Solve a single input file of a day, with day-specific options."""
+    solver = get_solver(day)
+    options = options or {}
+
+    def run() -> Result:
+        with open_input(path, solver.mode) as data:
+            return solver.solve(data, **options)
+
+    if no_cache:
+        return run()
+
+    cache = ResultCache()
+    key = cache.key(day, path, options)
+
+    if (cached := cache.get(key)) is not None:
+        with contextlib.suppress(ValidationError):
+            return Result.parse_raw(cached)
+
+    result = run()
+    cache.put(key, result.json())
+    return result
+
+
+def format_result(result: Result) -> list[str]:
+    """Format a result the way the command of its day shows it."""
+    return get_solver(result.day).show(result)
+
+
+def solver_command(
+    name: str,
+    solve: Solve,
+    options: Sequence[Callable[[Callable], Callable]] = (),
+    mode: InputMode = InputMode.TEXT,
+) -> Callable[[Show], click.Command]:
+    """Turn a function that formats a result into lines into a cached day command.
+
+    Values of the extra click options are passed on to solve as keyword arguments.
+    The mode determines whether solve gets the text, an open file or raw bytes.
+    """
+
+    def decorator(function: Show) -> click.Command:
+        _solvers[name] = Solver(solve=solve, show=function, mode=mode)
+
+        @click.command(name=name)
+        @click.option(
+            "--path",
+            "paths",
+            multiple=True,
+            required=True,
+            help="Input file, directory or glob pattern. Can be repeated.",
+        )
+        @click.option("--workers", type=int, default=1, help="Number of processes.")
+        @click.option("--json", "as_json", is_flag=True, help="Output JSON records.")
+        @click.option("--no-cache", is_flag=True, help="Do not use cached results.")
+        @functools.wraps(function)
+        def command(
+            paths: tuple[str, ...],
+            workers: int,
+            as_json: bool,
+            no_cache: bool,
+            **solve_options: Any,
+        ) -> None:
+            files = expand_paths(paths)
+            solve_path = functools.partial(
+                solve_file, name, no_cache=no_cache, options=solve_options
+            )
+
+            if len(files) == 1 and not as_json:
+                for line in function(solve_path(files[0])):
+                    click.echo(line)
+                return
+
+            with (
+                ProcessPoolExecutor(max_workers=workers)
+                if workers > 1
+                else contextlib.nullcontext()
+            ) as executor:
+                results = (
+                    executor.map(solve_path, files)
+                    if executor
+                    else map(solve_path, files)
+                )
+
+                for path, result in zip(files, results):
+                    if as_json:
+                        click.echo(json.dumps({"path": str(path), **result.dict()}))
+                    else:
+                        click.echo(f"{path}\t{' | '.join(format_result(result))}")
+
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorator
@@ -1,36 +1,77 @@
 """Solution for day 1 of Advent of Code."""
-# pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
-from pathlib import Path
+import heapq
+import io
+from functools import partial
+from typing import Iterable
 
 import click
-import click_pathlib
-from pydantic import BaseModel
 
+from ..cli import solver_command
+from ..inputs import InputMode
+from ..result import Result, solve_parts
 
-class Elf(BaseModel):
-    """Elf representation."""
 
-    calories: list[int]
+def _totals(lines: Iterable[str]) -> Iterable[int]:
+    """Yield the total calories of each elf while reading lines one by one."""
+    total, carrying = 0, False
 
-    @property
-    def total(self) -> int:
-        """Determine sum of calories."""
-        return sum(self.calories)
+    for line in lines:
+        if line := line.strip():
+            total += int(line)
+            carrying = True
+        elif carrying:
+            yield total
+            total, carrying = 0, False
 
+    if carrying:
+        yield total
 
-@click.command(name="day01")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
+
+def parse(lines: Iterable[str], top: int = 3) -> list[int]:
+    """Find the highest totals of calories, keeping only the top elves in memory."""
+    heap: list[int] = []
+
+    for total in _totals(lines):
+        if len(heap) < top:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+
+    return sorted(heap, reverse=True)
+
+
+def part_one(totals: list[int]) -> int:
+    """Determine the maximum number of calories, which is 0 without any elves."""
+    return totals[0] if totals else 0
+
+
+def part_two(totals: list[int]) -> int:
+    """Determine the total of the top elves."""
+    return sum(totals)
+
+
+def solve(data: str | Iterable[str], top: int = 3) -> Result:
+    """Solve both parts of day 1 from text or a stream of lines."""
+    lines = io.StringIO(data) if isinstance(data, str) else data
+    return solve_parts("day01", lines, partial(parse, top=top), part_one, part_two)
+
+
+@solver_command(
+    name="day01",
+    solve=solve,
+    options=[
+        click.option(
+            "--top",
+            type=click.IntRange(min=1),
+            default=3,
+            help="Number of elves to add up.",
+        )
+    ],
+    mode=InputMode.LINES,
+)
+def main(result: Result) -> list[str]:
     """Solve day 1."""
-    elves = sorted(
-        [
-            Elf(calories=calories.splitlines())
-            for calories in path.read_text(encoding="utf-8").split("\n\n")
-        ],
-        key=lambda x: x.total if x else 0,
-        reverse=True,
-    )
-
-    # pylint: disable=consider-using-generator
-    print(f"Maximum number of calories: {elves[0].total}")
-    print(f"Total of top three: {sum([t.total for t in elves[:3]])}")
+    return [
+        f"Maximum number of calories: {result.part_one}",
+        f"Total of top elves: {result.part_two}",
+    ]
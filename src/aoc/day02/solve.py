@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from enum import Enum, auto
-from pathlib import Path
 
-import click
-import click_pathlib
+import numpy as np
 from pydantic.main import BaseModel
 
+from ..cli import solver_command
+from ..inputs import InputMode
+from ..result import Result, solve_parts
+
 
 class Hand(Enum):
     """Potential hands to play."""
@@ -109,6 +111,10 @@ outcome_mapping: dict[str, Outcome] = {
     "Z": Outcome.WIN,
 }
 
+OPPONENT = "ABC"
+CHOICE = "XYZ"
+CHUNK_SIZE = 1 << 24
+
 
 def _to_round(line: str, mode: DecryptionMode) -> Round:
     """Convert a single line to a round."""
@@ -123,26 +129,70 @@ def _to_round(line: str, mode: DecryptionMode) -> Round:
     )
 
 
-@click.command(name="day02")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 2."""
-    hand_decryption = Match(
-        rounds=[
-            _to_round(p, DecryptionMode.HANDS)
-            for p in path.read_text(encoding="utf-8").splitlines()
-            if p
-        ]
-    )
-    outcome_decryption = Match(
-        rounds=[
-            _to_round(p, DecryptionMode.OUTCOME)
-            for p in path.read_text(encoding="utf-8").splitlines()
-            if p
-        ]
+def _score_table(mode: DecryptionMode) -> np.ndarray:
+    """Points of each of the nine possible rounds, indexed by round code."""
+    return np.array(
+        [_to_round(f"{o} {c}", mode).points for o in OPPONENT for c in CHOICE]
     )
 
-    # fmt: off
-    print(f"[1] Total points with hand decryption: {hand_decryption.points_total}.")
-    print(f"[2] Total points with outcome decryption: {outcome_decryption.points_total}.")
-    # fmt: on
+
+SCORES: dict[DecryptionMode, np.ndarray] = {
+    mode: _score_table(mode) for mode in DecryptionMode
+}
+
+
+def _count_chunk(chunk: np.ndarray) -> np.ndarray:
+    """Count how often each of the nine possible rounds occurs in a chunk."""
+    opponent = chunk[(chunk >= ord(OPPONENT[0])) & (chunk <= ord(OPPONENT[-1]))]
+    choice = chunk[(chunk >= ord(CHOICE[0])) & (chunk <= ord(CHOICE[-1]))]
+
+    if len(opponent) != len(choice):
+        raise ValueError("Every round needs both an opponent and a choice.")
+
+    codes = (opponent - ord(OPPONENT[0])) * 3 + (choice - ord(CHOICE[0]))
+    return np.bincount(codes, minlength=9)
+
+
+def parse(data: bytes | str) -> np.ndarray:
+    """Count each of the nine possible rounds in a single pass over the bytes."""
+    if isinstance(data, str):
+        data = data.encode()
+
+    counts = np.zeros(9, dtype=np.int64)
+    start = 0
+
+    while start < len(data):
+        end = min(start + CHUNK_SIZE, len(data))
+        if end < len(data):
+            end = data.rfind(b"\n", start, end) + 1 or end
+
+        counts += _count_chunk(
+            np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+        )
+        start = end
+
+    return counts
+
+
+def part_one(counts: np.ndarray) -> int:
+    """Determine total points with hand decryption."""
+    return int(counts @ SCORES[DecryptionMode.HANDS])
+
+
+def part_two(counts: np.ndarray) -> int:
+    """Determine total points with outcome decryption."""
+    return int(counts @ SCORES[DecryptionMode.OUTCOME])
+
+
+def solve(data: bytes | str) -> Result:
+    """Solve both parts of day 2."""
+    return solve_parts("day02", data, parse, part_one, part_two)
+
+
+@solver_command(name="day02", solve=solve, mode=InputMode.BYTES)
+def main(result: Result) -> list[str]:
+    """Solve day 2."""
+    return [
+        f"[1] Total points with hand decryption: {result.part_one}.",
+        f"[2] Total points with outcome decryption: {result.part_two}.",
+    ]
@@ -2,92 +2,83 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
+import io
 import string
-from functools import reduce
-from pathlib import Path
+from typing import Iterable
 
-import click
-import click_pathlib
-from pydantic import BaseModel
+from ..cli import solver_command
+from ..inputs import InputMode
+from ..result import Result, solve_parts
 
 
-class Compartment(BaseModel):
-    """A single compartment within a rucksack."""
+PRIORITIES: dict[str, int] = {
+    character: priority
+    for priority, character in enumerate(string.ascii_letters, start=1)
+}
+GROUP_SIZE = 3
 
-    items: set[str]
 
-    def __and__(self, other: Compartment) -> set[str]:
-        """Determine overlap between two compartments."""
-        return self.items.intersection(other.items)
+def _to_mask(items: str) -> int:
+    """Encode a set of items as an integer with the bit of each priority set."""
+    mask = 0
+    for item in items:
+        mask |= 1 << PRIORITIES[item]
+    return mask
 
 
-def _to_priority(character: str) -> int:
-    """Convert a character into a priority."""
-    return string.ascii_letters.index(character) + 1
+def _mask_priority(mask: int) -> int:
+    """Sum the priorities of all items within a mask."""
+    total = 0
+    while mask:
+        lowest = mask & -mask
+        total += lowest.bit_length() - 1
+        mask ^= lowest
+    return total
 
 
-class Rucksack(BaseModel):
-    """A rucksack carried by an elf."""
+def parse(lines: Iterable[str]) -> tuple[int, int]:
+    """Sum compartment and group priorities in a single pass over the rucksacks."""
+    compartment_total, group_total = 0, 0
+    group_mask, group_members = 0, 0
 
-    items: list[str]
+    for line in lines:
+        if not (items := line.strip()):
+            continue
 
-    @property
-    def compartments(self) -> tuple[Compartment, Compartment]:
-        """Split a list of characters into compartments."""
-        return self._split_into_compartments(self.items)
+        middle = len(items) // 2
+        compartment_total += _mask_priority(
+            _to_mask(items[:middle]) & _to_mask(items[middle:])
+        )
 
-    @property
-    def priority(self) -> int:
-        """Determine priority within a single rucksack."""
-        overlap = self.compartments[0] & self.compartments[1]
-        overlap_priorities = [_to_priority(c) for c in overlap]
+        group_mask = _to_mask(items) & (group_mask if group_members else -1)
+        group_members += 1
+        if group_members == GROUP_SIZE:
+            group_total += (group_mask & -group_mask).bit_length() - 1
+            group_mask, group_members = 0, 0
 
-        return sum(overlap_priorities)
+    return compartment_total, group_total
 
-    @staticmethod
-    def _split_into_compartments(
-        items: list[str], parts: int = 2
-    ) -> tuple[Compartment, Compartment]:
-        """Split line of text into two compartments."""
-        length = len(items)
 
-        # fmt: off
-        return \
-            Compartment(items=set(items[: int(length / parts)])),\
-            Compartment(items=set(items[int(length / parts) :]))
-        # fmt: on
+def part_one(totals: tuple[int, int]) -> int:
+    """Determine sum of compartment priorities."""
+    return totals[0]
 
 
-class ElfGroup(BaseModel):
-    """A group of elves who carry rucksacks."""
+def part_two(totals: tuple[int, int]) -> int:
+    """Determine sum of group priorities."""
+    return totals[1]
 
-    rucksacks: list[Rucksack]
 
-    @property
-    def badge(self):
-        """Determine group badge."""
-        item_sets = [set(r.items) for r in self.rucksacks]
+def solve(data: str | Iterable[str]) -> Result:
+    """Solve both parts of day 3 from text or a stream of lines."""
+    lines = io.StringIO(data) if isinstance(data, str) else data
+    return solve_parts("day03", lines, parse, part_one, part_two)
 
-        return next(iter(reduce(lambda x, y: x & y, item_sets)))
 
-    @property
-    def priority(self) -> int:
-        """Find priority of a group."""
-        return _to_priority(self.badge)
-
-
-@click.command(name="day03")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
+@solver_command(name="day03", solve=solve, mode=InputMode.LINES)
+def main(result: Result) -> list[str]:
     """Solve day 3."""
-    rucksacks = [
-        Rucksack(items=list(r)) for r in path.read_text(encoding="utf-8").splitlines()
+    return [
+        f"[1] Sum of compartment priorities: {result.part_one}",
+        f"[2] Sum of group priorities: {result.part_two}",
     ]
-
-    groups = [
-        ElfGroup(rucksacks=rucksacks[g : g + 3]) for g in range(0, len(rucksacks), 3)
-    ]
-
-    # pylint: disable=consider-using-generator
-    print(f"[1] Sum of compartment priorities: {sum([r.priority for r in rucksacks])}")
-    print(f"[2] Sum of group priorities: {sum([g.priority for g in groups])}")
@@ -2,76 +2,232 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from pathlib import Path
+from functools import partial
+from typing import Any
 
 import click
-import click_pathlib
+import numpy as np
 
+from ..cli import solver_command
+from ..result import Result, solve_parts
 
-@dataclass
+
+@dataclass(frozen=True)
 class Elf:
-    """Represent a single elf."""
+    """Represent a single elf by the first and last section of its assignment."""
 
-    range_identifier: str
+    start: int
+    end: int
 
-    @property
-    def range(self) -> set[int]:
-        """Find range of assignments for elf."""
-        range_boundaries = [int(i) for i in self.range_identifier.split("-")]
-        return set(range(range_boundaries[0], range_boundaries[1] + 1))
+    @classmethod
+    def from_identifier(cls, range_identifier: str) -> Elf:
+        """Create an elf from a range identifier such as 2-4."""
+        start, end = range_identifier.split("-")
+        return cls(start=int(start), end=int(end))
 
     def __repr__(self) -> str:
         """Represent an elf."""
-        return f"Elf(range={self.range_identifier})"
-
-    def __and__(self, other: Elf) -> bool:
-        """Determine whether one elf's assignments overlap with another."""
-        return self.range <= other.range or other.range <= self.range
-
-    def __or__(self, other: Elf) -> bool:
-        """Determine whether one elf's assignments overlap with another."""
-        return bool(self.range.intersection(other.range))
-
-
-@dataclass
-class CampPair:
-    """A pair of elves within the camp."""
-
-    raw_data: str
-
-    @property
-    def elves(self) -> list[Elf]:
-        """Elves within a camp pair."""
-        return [Elf(range_identifier=e) for e in self.raw_data.split(",")]
-
-    def __repr__(self) -> str:
-        """Represent a pair."""
-        return f"CampPair(elves={str(self.elves)})"
-
-    @property
-    def full_overlap(self) -> bool:
-        """Determine whether there's full overlap between two elves."""
-        elves = self.elves
-        return elves[0] & elves[1]
-
-    @property
-    def overlap(self) -> bool:
-        """Determine whether there's some overlap between two elves."""
-        elves = self.elves
-        return elves[0] | elves[1]
-
-
-@click.command(name="day04")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
+        return f"Elf(range={self.start}-{self.end})"
+
+
+def parse(data: str) -> np.ndarray:
+    """Parse input into an array of pairs of (start, end) assignments."""
+    if not (data := data.strip()):
+        return np.empty((0, 2, 2), dtype=np.int64)
+
+    return np.array(re.split(r"[^\d]+", data), dtype=np.int64).reshape(-1, 2, 2)
+
+
+def full_overlaps(pairs: np.ndarray) -> np.ndarray:
+    """Determine for each pair whether one assignment contains the other."""
+    first, second = pairs[:, 0], pairs[:, 1]
+    return ((first[:, 0] <= second[:, 0]) & (second[:, 1] <= first[:, 1])) | (
+        (second[:, 0] <= first[:, 0]) & (first[:, 1] <= second[:, 1])
+    )
+
+
+def overlaps(pairs: np.ndarray) -> np.ndarray:
+    """Determine for each pair whether the assignments overlap at all."""
+    first, second = pairs[:, 0], pairs[:, 1]
+    return (first[:, 0] <= second[:, 1]) & (second[:, 0] <= first[:, 1])
+
+
+class AssignmentIndex:
+    """Index over all assignments to query overlaps and coverage of sections."""
+
+    def __init__(self, assignments: np.ndarray):
+        """Build the index from an array of (start, end) assignments."""
+        self.assignments = assignments[np.argsort(assignments[:, 0], kind="stable")]
+        self.starts = self.assignments[:, 0]
+        self.ends = np.sort(assignments[:, 1])
+
+        # Segment tree with the maximum end of the assignments below each node.
+        self._leaves = 1 << max(len(assignments) - 1, 0).bit_length()
+        self._max_end = np.full(2 * self._leaves, np.iinfo(np.int64).min)
+        self._max_end[
+            self._leaves : self._leaves + len(assignments)
+        ] = self.assignments[:, 1]
+        level = self._leaves
+        while level > 1:
+            self._max_end[level // 2 : level] = np.maximum(
+                self._max_end[level : 2 * level : 2],
+                self._max_end[level + 1 : 2 * level : 2],
+            )
+            level //= 2
+
+    def overlapping(self, start: int, end: int) -> np.ndarray:
+        """Find all assignments that overlap with a range of sections.
+
+        Only assignments starting at or before the end of the range qualify, and
+        subtrees without any assignment ending at or after its start are skipped.
+        """
+        limit = int(np.searchsorted(self.starts, end, side="right"))
+        found: list[int] = []
+        nodes = [(1, 0, self._leaves)]
+
+        while nodes:
+            node, low, high = nodes.pop()
+            if low >= limit or self._max_end[node] < start:
+                continue
+            if node >= self._leaves:
+                found.append(low)
+            else:
+                middle = (low + high) // 2
+                nodes.append((2 * node + 1, middle, high))
+                nodes.append((2 * node, low, middle))
+
+        return self.assignments[found]
+
+    def coverage(self, section: int) -> int:
+        """Count the elves that are assigned to a section."""
+        started = np.searchsorted(self.starts, section, side="right")
+        ended = np.searchsorted(self.ends, section, side="left")
+        return int(started - ended)
+
+    def coverage_segments(self) -> np.ndarray:
+        """Sweep over all assignments to find (start, end, elves) segments."""
+        positions = np.concatenate([self.starts, self.ends + 1])
+        changes = np.concatenate(
+            [np.ones(len(self.starts)), -np.ones(len(self.ends))]
+        ).astype(np.int64)
+
+        boundaries, inverse = np.unique(positions, return_inverse=True)
+        net_changes = np.bincount(inverse, weights=changes).astype(np.int64)
+
+        # Assignments that end right where others start do not split a segment.
+        changed = net_changes != 0
+        boundaries = boundaries[changed]
+        elves = np.cumsum(net_changes[changed])
+
+        return np.column_stack([boundaries[:-1], boundaries[1:] - 1, elves[:-1]])
+
+    def max_coverage(self) -> tuple[int, int, int]:
+        """Find the first range of sections covered by the most elves."""
+        segments = self.coverage_segments()
+        if not len(segments):
+            return 0, 0, 0
+
+        start, end, elves = segments[np.argmax(segments[:, 2])]
+        return int(elves), int(start), int(end)
+
+
+def part_one(pairs: np.ndarray) -> int:
+    """Determine number of fully overlapping pairs."""
+    return int(full_overlaps(pairs).sum())
+
+
+def part_two(pairs: np.ndarray) -> int:
+    """Determine number of partially overlapping pairs."""
+    return int(overlaps(pairs).sum())
+
+
+def _section_range(
+    _: click.Context, __: click.Parameter, value: str | None
+) -> tuple[int, int] | None:
+    """Convert an option such as 2-4 into a range of sections."""
+    if value is None:
+        return None
+    try:
+        elf = Elf.from_identifier(value)
+    except ValueError as error:
+        raise click.BadParameter("Expected a range such as 2-4.") from error
+    if elf.start > elf.end:
+        raise click.BadParameter(f"Range {value} ends before it starts.")
+    return elf.start, elf.end
+
+
+def _query(
+    pairs: np.ndarray,
+    overlapping: tuple[int, int] | None,
+    coverage: int | None,
+    max_coverage: bool,
+) -> dict[str, Any]:
+    """Count the pairs, and answer queries about all assignments in the input."""
+    details: dict[str, Any] = {"pairs": len(pairs)}
+    if not overlapping and coverage is None and not max_coverage:
+        return details
+
+    index = AssignmentIndex(pairs.reshape(-1, 2))
+    if overlapping:
+        details["overlapping"] = index.overlapping(*overlapping).tolist()
+    if coverage is not None:
+        details["coverage"] = index.coverage(coverage)
+    if max_coverage:
+        details["max_coverage"] = index.max_coverage()
+
+    return details
+
+
+def solve(
+    data: str,
+    overlapping: tuple[int, int] | None = None,
+    coverage: int | None = None,
+    max_coverage: bool = False,
+) -> Result:
+    """Solve both parts of day 4, and optionally query all assignments."""
+    details = partial(
+        _query,
+        overlapping=overlapping,
+        coverage=coverage,
+        max_coverage=max_coverage,
+    )
+    return solve_parts("day04", data, parse, part_one, part_two, details)
+
+
+@solver_command(
+    name="day04",
+    solve=solve,
+    options=[
+        click.option(
+            "--overlapping",
+            callback=_section_range,
+            help="Find assignments overlapping a range of sections, e.g. 2-4.",
+        ),
+        click.option("--coverage", type=int, help="Count elves assigned to a section."),
+        click.option(
+            "--max-coverage",
+            is_flag=True,
+            help="Find the sections that are covered by the most elves.",
+        ),
+    ],
+)
+def main(result: Result) -> list[str]:
     """Solve day 4."""
-    pairs = [
-        CampPair(raw_data=p) for p in path.read_text(encoding="utf-8").splitlines() if p
+    out_of = f" out of {result.details['pairs']}" if "pairs" in result.details else ""
+    lines = [
+        f"[1] Full overlapping pairs: {result.part_one}{out_of}.",
+        f"[2] Partially overlapping pairs: {result.part_two}{out_of}.",
     ]
 
-    # fmt: off
-    # pylint: disable=consider-using-generator,line-too-long
-    print(f"[1] Full overlapping pairs: {sum([1 for v in pairs if v.full_overlap])} out of {len(pairs)}.")
-    print(f"[2] Partially overlapping pairs: {sum([1 for v in pairs if v.overlap])} out of {len(pairs)}.")
-    # fmt: on
+    if "overlapping" in result.details:
+        assignments = [f"{start}-{end}" for start, end in result.details["overlapping"]]
+        lines.append(f"[x] Overlapping assignments: {', '.join(assignments)}")
+    if "coverage" in result.details:
+        lines.append(f"[x] Elves assigned to section: {result.details['coverage']}")
+    if "max_coverage" in result.details:
+        elves, start, end = result.details["max_coverage"]
+        lines.append(f"[x] Maximum coverage: {elves} elves on sections {start}-{end}")
+
+    return lines
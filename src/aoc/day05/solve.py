@@ -2,15 +2,19 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
-from pathlib import Path
+import re
 
-import click
-import click_pathlib
+import numpy as np
 from pydantic import BaseModel
 
+from ..cli import solver_command
+from ..result import Result, solve_parts
+
+MOVE_PATTERN = re.compile(r"move (\d+) from (\d+) to (\d+)")
+
 
 class Stack(BaseModel):
-    """A stack of crates."""
+    """A stack of crates, with the top crate at the end."""
 
     crates: list[str] = []
 
@@ -36,28 +40,41 @@ class Structure(BaseModel):
             items=int(items), start=int(start) - 1, towards=int(towards) - 1
         )
 
+    def move(self, items: int, start: int, towards: int, multiple: bool) -> Structure:
+        """Move crates from the top of one stack to another.
+
+        A crane that moves a single crate at the same time reverses their order.
+        """
+        crates = self.stacks[start].crates
+        if items > len(crates):
+            raise IndexError(
+                f"Cannot move {items} crates from stack {start + 1} with {len(crates)}."
+            )
+
+        taken = crates[len(crates) - items :]
+        del crates[len(crates) - items :]
+
+        self.stacks[towards].crates.extend(taken if multiple else reversed(taken))
+        return self
+
     def single_move(self, instruction: str) -> Structure:
         """Move a single crate at the same time."""
         instructions = self._to_instructions(instruction)
-
-        for _ in range(instructions.items):
-            item = self.stacks[instructions.start].crates[0]
-            self.stacks[instructions.towards].crates = [item] + self.stacks[
-                instructions.towards
-            ].crates
-            del self.stacks[instructions.start].crates[0]
-        return self
+        return self.move(
+            instructions.items, instructions.start, instructions.towards, False
+        )
 
     def multi_move(self, instruction: str) -> Structure:
         """Move multiple crates at the same time."""
         instructions = self._to_instructions(instruction)
-        crates = self.stacks[instructions.start].crates[0 : instructions.items]
-        self.stacks[instructions.towards].crates = (
-            list(crates) + self.stacks[instructions.towards].crates
+        return self.move(
+            instructions.items, instructions.start, instructions.towards, True
         )
-        del self.stacks[instructions.start].crates[0 : instructions.items]
 
-        return self
+    @property
+    def top_crates(self) -> str:
+        """Names of the crates on top of each stack."""
+        return "".join([s.crates[-1] for s in self.stacks])
 
 
 def _parse_stacks(data: str) -> Structure:
@@ -75,31 +92,56 @@ def _parse_stacks(data: str) -> Structure:
             try:
                 crate_name = data[row][1 + column * 4]
                 if crate_name.strip():
-                    base_structure.stacks[column].crates.insert(0, crate_name)
+                    base_structure.stacks[column].crates.append(crate_name)
             except IndexError:
                 pass
 
     return base_structure
 
 
-@click.command(name="day05")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 5."""
-    structure_data, moves = path.read_text().split("\n\n")
-    single_move_structure = _parse_stacks(structure_data.split("\n"))
+def parse(data: str) -> tuple[Structure, np.ndarray]:
+    """Parse input into the initial structure and an array of moves."""
+    structure_data, moves = data.split("\n\n")
+    return _parse_stacks(structure_data.split("\n")), _parse_moves(moves)
 
-    for move in moves.splitlines():
-        single_move_structure.single_move(instruction=move)
 
-    print(
-        f"[1] Top crates: {''.join([s.crates[0] for s in single_move_structure.stacks])}"
-    )
+def _parse_moves(data: str) -> np.ndarray:
+    """Parse all moves at once into an array of (items, start, towards) rows."""
+    moves = np.array(MOVE_PATTERN.findall(data), dtype=np.int64).reshape(-1, 3)
+    moves[:, 1:] -= 1
+    return moves
 
-    multi_move_structure = _parse_stacks(structure_data.split("\n"))
-    for move in moves.splitlines():
-        multi_move_structure.multi_move(instruction=move)
 
-    print(
-        f"[2] Top crates: {''.join([s.crates[0] for s in multi_move_structure.stacks])}"
-    )
+def _operate_crane(puzzle: tuple[Structure, np.ndarray], multiple: bool) -> str:
+    """Execute all moves on a copy of the structure and find the top crates."""
+    structure, moves = puzzle
+    structure = structure.copy(deep=True)
+
+    for items, start, towards in moves.tolist():
+        structure.move(items, start, towards, multiple)
+
+    return structure.top_crates
+
+
+def part_one(puzzle: tuple[Structure, np.ndarray]) -> str:
+    """Determine top crates when moving a single crate at the same time."""
+    return _operate_crane(puzzle, multiple=False)
+
+
+def part_two(puzzle: tuple[Structure, np.ndarray]) -> str:
+    """Determine top crates when moving multiple crates at the same time."""
+    return _operate_crane(puzzle, multiple=True)
+
+
+def solve(data: str) -> Result:
+    """Solve both parts of day 5."""
+    return solve_parts("day05", data, parse, part_one, part_two)
+
+
+@solver_command(name="day05", solve=solve)
+def main(result: Result) -> list[str]:
+    """Solve day 5."""
+    return [
+        f"[1] Top crates: {result.part_one}",
+        f"[2] Top crates: {result.part_two}",
+    ]
@@ -2,32 +2,264 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterator
+from typing import Hashable, Iterable, Iterator, Sequence
 
 import click
-import click_pathlib
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..cli import solver_command
+from ..inputs import InputMode, read_buffer
+from ..result import Result, solve_parts
+
+PACKET_SIZE = 4
+MESSAGE_SIZE = 14
+CHUNK_SIZE = 1 << 20
+PARALLEL_CHUNK_SIZE = 1 << 24
+
+
+def find_markers(
+    chunks: Iterable[Iterable[Hashable]], window_sizes: Iterable[int]
+) -> dict[int, int]:
+    """Find the first marker of several window sizes in a single pass.
+
+    The run of distinct signals that ends at the current position is shared by all
+    window sizes, and follows from the position at which each signal was last seen.
+    """
+    markers = {size: 0 for size in window_sizes}
+    pending = sorted(markers)
+    last_seen: dict[Hashable, int] = {}
+    run_start, position = 0, 0
+
+    for chunk in chunks:
+        for signal in chunk:
+            position += 1
+            run_start = max(run_start, last_seen.get(signal, 0))
+            last_seen[signal] = position
+
+            while (
+                pending and pending[0] <= position - run_start and pending[0] < position
+            ):
+                markers[pending.pop(0)] = position
+            if not pending:
+                return markers
+
+    return markers
 
 
 def find_marker(message: Iterator[str], minimum_signals: int) -> int:
     """Find the marker within a message."""
-    # fmt: off
-    window = []
-    for index, value in enumerate(message):
-        window.append(value)
-        if index + 1 > minimum_signals \
-                and len(window[-minimum_signals:]) == len(set(window[-minimum_signals:])):
-            return index + 1
-    return 0
-    # fmt: on
-
-
-@click.command(name="day06")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
+    return find_markers([message], [minimum_signals])[minimum_signals]
+
+
+def _chunks(data: bytes | str, size: int = CHUNK_SIZE) -> Iterator[bytes | str]:
+    """Split data into chunks of a fixed size."""
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _previous_occurrences(signals: np.ndarray) -> np.ndarray:
+    """Determine for each signal the index at which it occurred before, or -1."""
+    order = np.argsort(signals, kind="stable")
+    same = signals[order[1:]] == signals[order[:-1]]
+
+    previous = np.full(len(signals), -1, dtype=np.int64)
+    previous[order[1:][same]] = order[:-1][same]
+    return previous
+
+
+def search_markers(
+    buffer: bytes | mmap.mmap,
+    start: int,
+    end: int,
+    window_sizes: Sequence[int],
+    find_all: bool = False,
+) -> dict[int, list[int]]:
+    """Find the markers that end within a part of a buffer.
+
+    The part is extended backwards by the largest window size minus one, so markers
+    that span the start of the part are found as well.
+    """
+    begin = max(0, start - max(window_sizes) + 1)
+    signals = np.frombuffer(buffer, dtype=np.uint8, count=end - begin, offset=begin)
+    previous = _previous_occurrences(signals)
+    markers: dict[int, list[int]] = {}
+
+    for size in window_sizes:
+        if len(signals) < size:
+            markers[size] = []
+            continue
+
+        latest = sliding_window_view(previous, size).max(axis=1)
+        positions = np.flatnonzero(latest < np.arange(len(latest))) + begin + size
+        positions = positions[(positions > start) & (positions > size)]
+        markers[size] = (positions if find_all else positions[:1]).tolist()
+
+    return markers
+
+
+def _search_file(
+    path: Path, start: int, end: int, window_sizes: Sequence[int], find_all: bool
+) -> dict[int, list[int]]:
+    """Memory-map a file and find the markers that end within a part of it."""
+    with path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        return search_markers(buffer, start, end, window_sizes, find_all)
+
+
+def find_markers_parallel(
+    path: Path,
+    window_sizes: Sequence[int],
+    processes: int | None = None,
+    find_all: bool = False,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> dict[int, list[int]]:
+    """Search overlapping chunks of a file for markers in a process pool."""
+    size = path.stat().st_size
+    starts = range(0, size, chunk_size)
+    ends = [min(start + chunk_size, size) for start in starts]
+    markers: dict[int, list[int]] = {window: [] for window in window_sizes}
+
+    if not size:
+        return markers
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        search = partial(
+            _search_file, path, window_sizes=window_sizes, find_all=find_all
+        )
+        for found in executor.map(search, starts, ends):
+            for window, positions in found.items():
+                if find_all or not markers[window]:
+                    markers[window].extend(positions)
+
+            if not find_all and all(markers.values()):
+                executor.shutdown(cancel_futures=True)
+                break
+
+    return markers
+
+
+def parse(
+    data: Path | bytes | str,
+    windows: Sequence[int] = (),
+    processes: int = 1,
+    all_markers: bool = False,
+) -> dict[int, list[int]]:
+    """Find the markers of all window sizes in the message.
+
+    Only the first marker of each window size is kept, unless all are asked for.
+    """
+    window_sizes = [PACKET_SIZE, MESSAGE_SIZE, *windows]
+
+    if isinstance(data, Path):
+        if processes > 1:
+            return find_markers_parallel(data, window_sizes, processes, all_markers)
+        with read_buffer(data) as buffer:
+            return parse(buffer, windows, all_markers=all_markers)
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    if all_markers:
+        markers: dict[int, list[int]] = {size: [] for size in window_sizes}
+        for start in range(0, len(data), PARALLEL_CHUNK_SIZE):
+            end = min(start + PARALLEL_CHUNK_SIZE, len(data))
+            for size, positions in search_markers(
+                data, start, end, window_sizes, find_all=True
+            ).items():
+                markers[size].extend(positions)
+        return markers
+
+    return {
+        size: [position] if position else []
+        for size, position in find_markers(_chunks(data), window_sizes).items()
+    }
+
+
+def part_one(markers: dict[int, list[int]]) -> int:
+    """Find the first start-of-packet marker."""
+    return next(iter(markers[PACKET_SIZE]), 0)
+
+
+def part_two(markers: dict[int, list[int]]) -> int:
+    """Find the first start-of-message marker."""
+    return next(iter(markers[MESSAGE_SIZE]), 0)
+
+
+def _details(
+    markers: dict[int, list[int]], windows: Sequence[int], all_markers: bool
+) -> dict[str, dict[int, int | list[int]]]:
+    """Collect markers of other window sizes, and all markers when asked for."""
+    details: dict[str, dict[int, int | list[int]]] = {}
+
+    if windows:
+        details["markers"] = {w: next(iter(markers[w]), 0) for w in windows}
+    if all_markers:
+        details["all_markers"] = markers
+
+    return details
+
+
+def solve(
+    data: Path | bytes | str,
+    windows: Sequence[int] = (),
+    processes: int = 1,
+    all_markers: bool = False,
+) -> Result:
+    """Solve both parts of day 6, and find markers of other window sizes.
+
+    With more than one process, a path to the input is searched in parallel.
+    """
+    return solve_parts(
+        "day06",
+        data,
+        partial(parse, windows=windows, processes=processes, all_markers=all_markers),
+        part_one,
+        part_two,
+        partial(_details, windows=windows, all_markers=all_markers)
+        if windows or all_markers
+        else None,
+    )
+
+
+@solver_command(
+    name="day06",
+    solve=solve,
+    options=[
+        click.option(
+            "--window",
+            "windows",
+            type=click.IntRange(min=1),
+            multiple=True,
+            help="Also find the first marker of this many distinct signals.",
+        ),
+        click.option(
+            "--processes",
+            type=click.IntRange(min=1),
+            default=1,
+            help="Search chunks of the input in this many processes.",
+        ),
+        click.option(
+            "--all-markers", is_flag=True, help="Find all markers, not only the first."
+        ),
+    ],
+    mode=InputMode.PATH,
+)
+def main(result: Result) -> list[str]:
     """Solve day 6."""
-    input_text = iter(path.read_text())
-    print(f"[1] First start-of-packet: {find_marker(input_text, 4)}.")
+    lines = [
+        f"[1] First start-of-packet: {result.part_one}.",
+        f"[2] First start-of-packet: {result.part_two}.",
+    ]
+
+    for window, marker in result.details.get("markers", {}).items():
+        lines.append(f"[x] First marker of {window} distinct signals: {marker}.")
+    for window, markers in result.details.get("all_markers", {}).items():
+        lines.append(f"[x] Markers of {window} distinct signals: {markers}")
 
-    input_text = iter(path.read_text())
-    print(f"[2] First start-of-packet: {find_marker(input_text, 14)}.")
+    return lines
@@ -2,159 +2,177 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
-from enum import Enum
-from pathlib import Path
+import io
+from bisect import bisect_left, insort
+from heapq import merge
+from typing import Any, Iterable
 
-import click
-import click_pathlib
-from pydantic import BaseModel
+from ..cli import solver_command
+from ..inputs import InputMode
+from ..result import Result, solve_parts
 
 MAX_SIZE = 100000
+TOTAL_DISK_SPACE = 70000000
+REQUIRED_SPACE = 30000000
+
+
+class FilesystemIndex:
+    """Sizes of all directories by full path, kept up to date while a log grows."""
+
+    MERGE_RATIO = 256
+
+    def __init__(self, lines: Iterable[str] = ()):
+        """Index the lines of a terminal log, starting in the root directory."""
+        self.sizes: dict[str, int] = {"/": 0}
+        self._files: dict[str, dict[str, int]] = {"/": {}}
+        self._ordered: list[tuple[int, str]] = [(0, "/")]
+        self._cwd: list[str] = ["/"]
+        self.feed(lines)
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Apply lines that were appended to the log.
+
+        Only the directories on the cwd stack receive the size of a new file. New
+        and changed directories are put in order of size once, at the end.
+        """
+        added: list[str] = []
+        deltas: dict[str, int] = {}
+
+        for line in lines:
+            match line.split():
+                case ["$", "cd", "/"]:
+                    del self._cwd[1:]
+                case ["$", "cd", ".."]:
+                    if len(self._cwd) > 1:
+                        self._cwd.pop()
+                case ["$", "cd", name]:
+                    self._cwd.append(self._add_directory(name, added))
+                case ["dir", name]:
+                    self._add_directory(name, added)
+                case [size, name] if size.isdigit():
+                    files = self._files[self._cwd[-1]]
+                    delta = int(size) - files.get(name, 0)
+                    files[name] = int(size)
+                    if delta:
+                        for path in self._cwd:
+                            deltas[path] = deltas.get(path, 0) + delta
+
+        self._reorder(set(added), deltas)
+
+    def _add_directory(self, name: str, added: list[str]) -> str:
+        """Register a directory within the cwd and return its full path."""
+        parent = self._cwd[-1]
+        path = f"{parent}{name}" if parent == "/" else f"{parent}/{name}"
+
+        if path not in self.sizes:
+            self.sizes[path] = 0
+            self._files[path] = {}
+            added.append(path)
+        return path
+
+    def _reorder(self, added: set[str], deltas: dict[str, int]) -> None:
+        """Resize directories, and order new and resized directories by size.
+
+        A few directories are moved one by one. Larger batches are sorted on their
+        own and merged with the unchanged directories in a single pass.
+        """
+        touched = added | deltas.keys()
+
+        if len(touched) * self.MERGE_RATIO < len(self._ordered):
+            for path in deltas.keys() - added:
+                size = self.sizes[path]
+                del self._ordered[bisect_left(self._ordered, (size, path))]
+            for path, delta in deltas.items():
+                self.sizes[path] += delta
+            for path in touched:
+                insort(self._ordered, (self.sizes[path], path))
+            return
+
+        for path, delta in deltas.items():
+            self.sizes[path] += delta
+        unchanged = [entry for entry in self._ordered if entry[1] not in touched]
+        self._ordered = list(
+            merge(unchanged, sorted((self.sizes[path], path) for path in touched))
+        )
 
+    def size(self, path: str = "/") -> int:
+        """Determine the size of a directory, such as /a/b."""
+        return self.sizes[path.rstrip("/") or "/"]
 
-class CommandType(Enum):
-    """Available command types."""
-
-    CD: str = "cd"
-    LS: str = "ls"
-
-
-class Command(BaseModel):
-    """A command on the filesystem."""
-
-    name: CommandType
-    argument: str | None = None
-    output_data: list[str] | None = None
-
-    @property
-    def outputs(self) -> tuple[dict[str, Directory], list[File]] | None:
-        """Convert output_data into a tuple of directories and files."""
-        if not self.output_data:
-            return self.output_data
-
-        directories, files = {}, []
+    def largest(self, count: int) -> list[tuple[str, int]]:
+        """Find the largest directories, largest first."""
+        ordered = self._ordered[max(len(self._ordered) - count, 0) :]
+        return [(path, size) for size, path in reversed(ordered)]
 
-        for line in list(self.output_data):
-            kind, name = line.split(" ")
+    def at_least(self, size: int) -> list[tuple[str, int]]:
+        """Find all directories of at least a certain size, smallest first."""
+        ordered = self._ordered[bisect_left(self._ordered, (size,)) :]
+        return [(path, directory_size) for directory_size, path in ordered]
 
-            if kind == "dir":
-                directories[name] = Directory(name=name)
-            else:
-                files.append(File(name=name, size=int(kind)))
+    def below(self, size: int) -> list[tuple[str, int]]:
+        """Find all directories smaller than a certain size, smallest first."""
+        ordered = self._ordered[: bisect_left(self._ordered, (size,))]
+        return [(path, directory_size) for directory_size, path in ordered]
 
-        return directories, files
 
-    def __str__(self) -> str:
-        return f"Command(name={self.name}, argument={self.argument}, outputs={self.outputs})"
+def parse(lines: Iterable[str]) -> FilesystemIndex:
+    """Index the size of every directory in a single pass over a terminal log.
 
+    Sizes are kept by full path along with the files of each directory, so that a
+    directory that is entered or listed again is not counted twice.
+    """
+    return FilesystemIndex(lines)
 
-class File(BaseModel):
-    """A single file."""
 
-    name: str
-    size: int
+def _required_delete(root_size: int) -> int:
+    """Determine how much space needs to be freed up."""
+    return REQUIRED_SPACE - (TOTAL_DISK_SPACE - root_size)
 
 
-class Directory(BaseModel):
-    """Represents a directory."""
+def part_one(index: FilesystemIndex) -> int:
+    """Determine total size of directories smaller than MAX_SIZE."""
+    return sum(size for _, size in index.below(MAX_SIZE))
 
-    name: str
-    directories: dict[str, Directory] = {}
-    files: list[File] = []
 
-    @property
-    def size(self) -> int:
-        """Determine size of directory."""
-        return sum(
-            [f.size for f in self.files] + [d.size for _, d in self.directories.items()]
-        )
+def _efficient_delete(index: FilesystemIndex) -> tuple[str, int]:
+    """Find the path and size of the smallest directory that frees up enough space."""
+    return index.at_least(_required_delete(index.size()))[0]
 
-    def execute_commands(self, commands: list[Command]) -> Directory:
-        """Execute commands within the directory."""
-        command = commands.pop(0)
-
-        match command:
-            case Command(name=CommandType.CD):
-                if command.argument == "..":
-                    return self
-                self.directories[command.argument].execute_commands(commands)
-            case Command(name=CommandType.LS):
-                self.directories, self.files = command.outputs
-
-        if commands:
-            return self.execute_commands(commands)
-        return self
-
-    @property
-    def maxed_size(self) -> int:
-        """Determine the total size of a directory, and only let them count
-        if it's smaller than MAX_SIZE."""
-        total_size = 0
-        size_increment = self.size
-
-        if size_increment < MAX_SIZE:
-            total_size += size_increment
-        # pylint: disable=consider-using-generator
-        total_size += sum(
-            [self.directories[sub_folder].maxed_size for sub_folder in self.directories]
-        )
 
-        return total_size
+def part_two(index: FilesystemIndex) -> int:
+    """Determine size of the smallest directory that frees up enough space."""
+    return _efficient_delete(index)[1]
 
-    def efficient_delete(
-        self, delete_size: int, found_directory: Directory | None = None
-    ) -> Directory | None:
-        """Determine which directory to delete given a certain required amount of free space."""
-        if (
-            found_directory and delete_size <= self.size < found_directory.size
-        ) or delete_size <= self.size:
-            found_directory = self
 
-        for directory in self.directories:
-            found_directory = self.directories[directory].efficient_delete(
-                delete_size, found_directory
-            )
-
-        return found_directory
+def _deletion(index: FilesystemIndex) -> dict[str, Any]:
+    """Describe which directory to delete and how much space is required."""
+    path, _ = _efficient_delete(index)
+    return {
+        "directory": path.rsplit("/", 1)[-1] or "/",
+        "required_delete": _required_delete(index.size()),
+    }
 
 
-def _parse_into_command(data: list[str]) -> Command:
-    """Parse a block of data into a Command object."""
-    command_arguments = data[0].split(" ")
-    base_command = Command(
-        name=getattr(CommandType, command_arguments[0].upper()),
-        argument=command_arguments[1] if len(command_arguments) > 1 else None,
-    )
-    if len(data) > 1:
-        setattr(base_command, "output_data", data[1:])
-    return base_command
+def solve(data: str | Iterable[str]) -> Result:
+    """Solve both parts of day 7 from text or a stream of lines."""
+    lines = io.StringIO(data) if isinstance(data, str) else data
+    return solve_parts("day07", lines, parse, part_one, part_two, _deletion)
 
 
-@click.command(name="day07")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
+@solver_command(name="day07", solve=solve, mode=InputMode.LINES)
+def main(result: Result) -> list[str]:
     """Solve day 7."""
-    command_blocks = path.read_text().split("$ ")
-    commands: list[Command] = []
-
-    for block in command_blocks:
-        if block := block.strip():
-            commands.append(_parse_into_command(block.split("\n")))
-
-    directories: dict[str, Directory] = {
-        "/": Directory(name=commands[0].argument).execute_commands(commands[1:])
-    }
-
-    print(f"[1] Total size: {directories['/'].maxed_size}")
-
-    total_disk_space = 70000000
-    required_space = 30000000
-    required_delete = required_space - (total_disk_space - directories["/"].size)
-
-    print(f"[x] Required to delete: {required_delete}")
-    delete_directory = directories["/"].efficient_delete(required_delete)
-    print(
-        f"[2] Delete directory: {delete_directory.name}. Its size is "
-        f"{delete_directory.size}, which leaves a free space "
-        f"of {delete_directory.size - required_delete}"
-    )
+    lines = [f"[1] Total size: {result.part_one}"]
+
+    if "required_delete" in result.details:
+        required_delete = result.details["required_delete"]
+        lines += [
+            f"[x] Required to delete: {required_delete}",
+            f"[2] Delete directory: {result.details['directory']}. Its size is "
+            f"{result.part_two}, which leaves a free space "
+            f"of {result.part_two - required_delete}",
+        ]
+    else:
+        lines.append(f"[2] Size of directory to delete: {result.part_two}")
+
+    return lines
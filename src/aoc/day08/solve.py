@@ -2,77 +2,209 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods
 from __future__ import annotations
 
-from pathlib import Path
+from typing import Any, Iterable, Iterator
 
-import click
-import click_pathlib
 import numpy as np
 
+from ..cli import solver_command
+from ..inputs import InputMode
+from ..result import Result, solve_parts
 
-def forrest_trees(trees: np.array, row: int, column: int) -> np.array:
-    """Yield all combinations of rows and columns - in reversed order, too."""
-    yield trees[row, column + 1 :]
-    yield np.flip(trees[:row, column])
 
-    yield trees[row + 1 :, column]
-    yield np.flip(trees[row, :column])
+def _orientations(grid: np.ndarray) -> Iterator[np.ndarray]:
+    """Yield views of a grid in which both row directions run towards the start."""
+    yield grid
+    yield grid[:, ::-1]
 
 
-def make_edges_visible(trees: np.array) -> np.array:
-    """Set empty grid with all edges set to visible."""
-    visible_trees = np.zeros_like(trees)
-    visible_trees[0, :] = 1
-    visible_trees[-1, :] = 1
-    visible_trees[:, 0] = 1
-    visible_trees[:, -1] = 1
+def _row_visibility(tree_grid: np.ndarray) -> np.ndarray:
+    """Determine which trees are visible from either end of their row."""
+    visible_trees = np.zeros(tree_grid.shape, dtype=bool)
+
+    for trees, visible in zip(_orientations(tree_grid), _orientations(visible_trees)):
+        tallest = np.maximum.accumulate(trees, axis=1)
+        visible[:, 0] = True
+        visible[:, 1:] |= trees[:, 1:] > tallest[:, :-1]
+
     return visible_trees
 
 
 def determine_visibility(tree_grid: np.array) -> np.array:
-    """Determine visibility of each of the trees."""
-    visible_trees = make_edges_visible(tree_grid)
-    rows, columns = tree_grid.shape
-    for row in range(1, rows - 1):
-        for column in range(1, columns - 1):
-            height = tree_grid[row, column]
-            for line in forrest_trees(tree_grid, row, column):
-                if np.all(line < height):
-                    visible_trees[row, column] = 1
-                    break
-    return visible_trees
+    """Determine visibility of each of the trees from running maxima."""
+    return _row_visibility(tree_grid) | _row_visibility(tree_grid.T).T
 
 
-def viewing_distance(height: int, line: np.array) -> np.array:
-    """Get viewing distance."""
-    matches = np.where(line >= height)[0]
-    return matches[0] + 1 if len(matches) else len(line)
+def _multiply_viewing_distances(trees: np.ndarray, scores: np.ndarray) -> None:
+    """Multiply scores by the viewing distance towards the start of each row.
 
+    Rather than a monotonic stack per row, keep the last column with a tree of at
+    least each height, for all rows at once, as heights only have a few levels.
+    """
+    levels = np.arange(int(trees.max()) + 1)
+    blocking = np.zeros((trees.shape[0], len(levels)), dtype=np.int64)
+    rows = np.arange(trees.shape[0])
+
+    for column in range(trees.shape[1]):
+        heights = trees[:, column]
+        scores[:, column] *= column - blocking[rows, heights]
+        blocking[levels <= heights[:, None]] = column
+
+
+def _row_scores(tree_grid: np.ndarray) -> np.ndarray:
+    """Determine the product of the viewing distances along the row of each tree."""
+    scores = np.ones(tree_grid.shape, dtype=np.int64)
+
+    for trees, direction_scores in zip(_orientations(tree_grid), _orientations(scores)):
+        _multiply_viewing_distances(trees, direction_scores)
 
-def determine_tree_scores(tree_grid: np.array) -> np.array:
-    """Determine scores of trees."""
-    scores = np.zeros_like(tree_grid)
-    rows, columns = tree_grid.shape
-    for row in range(1, rows - 1):
-        for column in range(1, columns - 1):
-            height = tree_grid[row, column]
-            distance = [
-                viewing_distance(height, line)
-                for line in forrest_trees(tree_grid, row, column)
-            ]
-            scores[row, column] = np.prod(distance)
     return scores
 
 
-@click.command(name="day08")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 8."""
-    trees = np.array(
-        [
-            [int(height) for height in tree_line]
-            for tree_line in path.read_text().splitlines()
-        ]
+def determine_tree_scores(tree_grid: np.array) -> np.array:
+    """Determine scores of trees from the viewing distances in all directions."""
+    return _row_scores(tree_grid) * _row_scores(tree_grid.T).T
+
+
+class Forest:
+    """Tree heights with their visibility and scores, to re-evaluate after changes.
+
+    Visibility and scores are kept separately for rows and for columns, so that a
+    changed tree only requires its own row and column to be evaluated again.
+    """
+
+    def __init__(self, trees: np.ndarray):
+        """Evaluate all trees of a grid."""
+        self.trees = trees.copy()
+        self._row_visible = _row_visibility(self.trees)
+        self._column_visible = _row_visibility(self.trees.T)
+        self._row_scores = _row_scores(self.trees)
+        self._column_scores = _row_scores(self.trees.T)
+
+        self.visible_count = int(self.visibility().sum())
+        self._row_max = self._scores(slice(None), slice(None)).max(axis=1)
+
+    def _visible(self, rows: Any, columns: Any) -> np.ndarray:
+        """Determine visibility of the trees in a selection of rows and columns."""
+        return self._row_visible[rows, columns] | self._column_visible[columns, rows].T
+
+    def _scores(self, rows: Any, columns: Any) -> np.ndarray:
+        """Determine scores of the trees in a selection of rows and columns."""
+        return self._row_scores[rows, columns] * self._column_scores[columns, rows].T
+
+    def _affected_count(self, rows: np.ndarray, columns: np.ndarray) -> int:
+        """Count visible trees in the rows and columns, counting crossings once."""
+        return int(
+            self._visible(rows, slice(None)).sum()
+            + self._visible(slice(None), columns).sum()
+            - self._visible(rows, slice(None))[:, columns].sum()
+        )
+
+    def visibility(self) -> np.ndarray:
+        """Determine visibility of each of the trees."""
+        return self._visible(slice(None), slice(None))
+
+    def tree_scores(self) -> np.ndarray:
+        """Determine scores of each of the trees."""
+        return self._scores(slice(None), slice(None))
+
+    @property
+    def max_score(self) -> int:
+        """Determine highest tree score."""
+        return int(self._row_max.max())
+
+    def update(self, updates: Iterable[tuple[int, int, int]]) -> None:
+        """Change heights of trees given as (row, column, height).
+
+        Only the rows and columns of the changed trees are evaluated again. Other
+        rows only need a new maximum score when their best tree got worse.
+        """
+        changes = list(updates)
+        if not changes:
+            return
+
+        for row, column, height in changes:
+            self.trees[row, column] = height
+        rows = np.unique([row for row, _, _ in changes])
+        columns = np.unique([column for _, column, _ in changes])
+
+        previous_count = self._affected_count(rows, columns)
+        previous_scores = self._scores(slice(None), columns).max(axis=1)
+
+        self._row_visible[rows] = _row_visibility(self.trees[rows])
+        self._column_visible[columns] = _row_visibility(self.trees.T[columns])
+        self._row_scores[rows] = _row_scores(self.trees[rows])
+        self._column_scores[columns] = _row_scores(self.trees.T[columns])
+
+        self.visible_count += self._affected_count(rows, columns) - previous_count
+
+        scores = self._scores(slice(None), columns).max(axis=1)
+        stale = (previous_scores == self._row_max) & (scores < self._row_max)
+        stale[rows] = True
+        self._row_max = np.maximum(self._row_max, scores)
+        if stale.any():
+            self._row_max[stale] = self._scores(stale, slice(None)).max(axis=1)
+
+
+def parse(data: bytes | str) -> np.ndarray:
+    """Parse input into a grid of tree heights, straight from the bytes of the rows.
+
+    The buffer is viewed as rows of digits, skipping the line breaks through the
+    strides, so the only copy is the one that turns digits into heights.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    end = len(data)
+    while end and data[end - 1] in b"\r\n":
+        end -= 1
+
+    newline = data.find(b"\n", 0, end)
+    if newline == -1:
+        width, stride = end, end + 1
+    else:
+        width = newline - 1 if data[newline - 1] == ord("\r") else newline
+        stride = newline + 1
+
+    rows = (end + stride - width) // stride
+    if (rows - 1) * stride + width != end:
+        raise ValueError("All rows of trees should have the same length.")
+
+    breaks = np.ndarray(
+        (rows - 1, stride - width),
+        dtype=np.uint8,
+        buffer=data,
+        offset=width,
+        strides=(stride, 1),
     )
+    if not np.all(breaks == np.frombuffer(data[width:stride], dtype=np.uint8)):
+        raise ValueError("All rows of trees should have the same length.")
 
-    print(f"[1] Visible trees: {determine_visibility(trees).sum()}")
-    print(f"[1] Tree scores: {determine_tree_scores(trees).max()}")
+    digits = np.ndarray((rows, width), dtype=np.uint8, buffer=data, strides=(stride, 1))
+    heights = digits - np.uint8(ord("0"))
+    if heights.size and heights.max() > 9:
+        raise ValueError("Tree heights should be digits.")
+    return heights
+
+
+def part_one(trees: np.array) -> int:
+    """Determine number of visible trees."""
+    return int(determine_visibility(trees).sum())
+
+
+def part_two(trees: np.array) -> int:
+    """Determine highest tree score."""
+    return int(determine_tree_scores(trees).max())
+
+
+def solve(data: bytes | str) -> Result:
+    """Solve both parts of day 8."""
+    return solve_parts("day08", data, parse, part_one, part_two)
+
+
+@solver_command(name="day08", solve=solve, mode=InputMode.BYTES)
+def main(result: Result) -> list[str]:
+    """Solve day 8."""
+    return [
+        f"[1] Visible trees: {result.part_one}",
+        f"[1] Tree scores: {result.part_two}",
+    ]
@@ -3,78 +3,308 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from functools import partial
+from typing import Callable, Protocol
 
 import click
-import click_pathlib
+import numpy as np
+
+from ..cli import solver_command
+from ..result import Result, solve_parts
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+DIRECTIONS = {"L": (0, -1), "R": (0, 1), "U": (-1, 0), "D": (1, 0)}
+
+
+class VisitedStore(Protocol):
+    """Cells visited by the end of the tail."""
+
+    def add(self, y: int, x: int) -> None:
+        """Mark a cell as visited."""
+
+    def add_run(self, y: int, x: int, step_y: int, step_x: int, count: int) -> None:
+        """Mark the cells of a run of steps that starts next to a cell as visited."""
+
+    def __len__(self) -> int:
+        """Count unique visited cells."""
+
+
+class SetVisited:
+    """Visited cells as a set of coordinate pairs."""
+
+    def __init__(self):
+        """Initialize without visited cells."""
+        self.cells: set[tuple[int, int]] = set()
+
+    def add(self, y: int, x: int) -> None:
+        """Mark a cell as visited."""
+        self.cells.add((y, x))
+
+    def add_run(self, y: int, x: int, step_y: int, step_x: int, count: int) -> None:
+        """Mark the cells of a run of steps that starts next to a cell as visited."""
+        self.cells.update(
+            (y + step * step_y, x + step * step_x) for step in range(1, count + 1)
+        )
+
+    def __len__(self) -> int:
+        """Count unique visited cells."""
+        return len(self.cells)
+
+
+class PackedVisited:
+    """Visited cells packed into int64 keys, which are deduplicated in batches.
+
+    Keys are collected in a batch of fixed size. A full batch is deduplicated on
+    its own, and only the keys that are new are inserted into the sorted unique
+    keys. That takes eight bytes per unique cell, plus the batch.
+    """
+
+    BATCH_SIZE = 1 << 16
+
+    def __init__(self):
+        """Initialize without visited cells."""
+        self._unique = np.empty(0, dtype=np.int64)
+        self._batch = np.empty(self.BATCH_SIZE, dtype=np.int64)
+        self._size = 0
+
+    def add(self, y: int, x: int) -> None:
+        """Mark a cell as visited."""
+        self._batch[self._size] = (y << 32) + (x & 0xFFFFFFFF)
+        self._size += 1
+        if self._size == len(self._batch):
+            self._merge()
+
+    def add_run(self, y: int, x: int, step_y: int, step_x: int, count: int) -> None:
+        """Mark the cells of a run of steps that starts next to a cell as visited."""
+        first = 1
+        while first <= count:
+            size = min(count - first + 1, len(self._batch) - self._size)
+            steps = np.arange(first, first + size, dtype=np.int64)
+            self._batch[self._size : self._size + size] = (
+                (y + steps * step_y) << 32
+            ) + ((x + steps * step_x) & 0xFFFFFFFF)
+            self._size += size
+            first += size
+            if self._size == len(self._batch):
+                self._merge()
+
+    def _merge(self) -> None:
+        """Insert the keys of the batch that are new into the unique keys."""
+        keys = np.unique(self._batch[: self._size])
+        positions = np.searchsorted(self._unique, keys)
+        found = np.zeros(len(keys), dtype=bool)
+        within = positions < len(self._unique)
+        found[within] = self._unique[positions[within]] == keys[within]
+
+        self._unique = np.insert(self._unique, positions[~found], keys[~found])
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Count unique visited cells."""
+        if self._size:
+            self._merge()
+        return len(self._unique)
+
+
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+class BitmapVisited:
+    """Visited cells in a bitmap that grows to cover the cells seen so far.
+
+    Each row packs eight cells into a byte, so it takes a bit per cell of the area
+    around all visited cells. That suits walks that keep returning to the same
+    area rather than walks that wander off.
+    """
+
+    def __init__(self, size: int = 64):
+        """Initialize an empty bitmap centered around the origin."""
+        self._bits = np.zeros((size, max(size // 8, 1)), dtype=np.uint8)
+        self._offset_y, self._offset_x = size // 2, 4 * self._bits.shape[1]
+
+    def _index(self, y: int, x: int) -> tuple[int, int]:
+        """Find the row and column of a cell, growing the bitmap to cover it."""
+        row, column = y + self._offset_y, x + self._offset_x
+        height, width = self._bits.shape
+
+        if not (0 <= row < height and 0 <= column >> 3 < width):
+            self._grow(row, column >> 3)
+            row, column = y + self._offset_y, x + self._offset_x
+
+        return row, column
+
+    def add(self, y: int, x: int) -> None:
+        """Mark a cell as visited."""
+        row, column = self._index(y, x)
+        self._bits[row, column >> 3] |= 1 << (column & 7)
+
+    def add_run(self, y: int, x: int, step_y: int, step_x: int, count: int) -> None:
+        """Mark the cells of a run of steps that starts next to a cell as visited."""
+        self._index(y + count * step_y, x + count * step_x)
+        row, column = self._index(y, x)
+        steps = np.arange(1, count + 1)
+        rows, columns = row + steps * step_y, column + steps * step_x
+        np.bitwise_or.at(
+            self._bits,
+            (rows, columns >> 3),
+            np.left_shift(1, columns & 7).astype(np.uint8),
+        )
+
+    def _grow(self, row: int, byte: int) -> None:
+        """At least double the bitmap towards a cell that falls outside of it."""
+        height, width = self._bits.shape
+        top = max(-row, height) if row < 0 else 0
+        bottom = max(row - height + 1, height) if row >= height else 0
+        left = max(-byte, width) if byte < 0 else 0
+        right = max(byte - width + 1, width) if byte >= width else 0
+
+        self._bits = np.pad(self._bits, ((top, bottom), (left, right)))
+        self._offset_y += top
+        self._offset_x += 8 * left
+
+    def __len__(self) -> int:
+        """Count unique visited cells."""
+        return int(POPCOUNT[self._bits].sum(dtype=np.int64))
+
+
+VISITED_STORES: dict[str, Callable[[], VisitedStore]] = {
+    "set": SetVisited,
+    "packed": PackedVisited,
+    "bitmap": BitmapVisited,
+}
+
+
 class Snake:
-    """A snake."""
+    """A snake, with the head and the knots of its tail in fixed-length lists."""
 
-    x: int = 0
-    y: int = 0
-    tail: list[list[int]]
-    visited: set[tuple[int, int]]
+    visited: VisitedStore
 
-    def __init__(self, tail_length: int = 1):
-        """Initialize snake with a certain tail length."""
-        self.visited = set()
+    def __init__(self, tail_length: int = 1, visited: VisitedStore | None = None):
+        """Initialize snake with a certain tail length and store of visited cells."""
+        self.visited = SetVisited() if visited is None else visited
         self.tail_length = tail_length
-        self.tail = [[0, 0] for _ in range(self.tail_length)]
+        self._ys = [0] * (tail_length + 1)
+        self._xs = [0] * (tail_length + 1)
+
+    @property
+    def x(self) -> int:
+        """Column of the head."""
+        return self._xs[0]
+
+    @property
+    def y(self) -> int:
+        """Row of the head."""
+        return self._ys[0]
+
+    @property
+    def tail(self) -> list[list[int]]:
+        """Positions of the knots of the tail as [y, x]."""
+        return [[y, x] for y, x in zip(self._ys[1:], self._xs[1:])]
 
     def move(self, instruction: str):
-        """Move the head of the snake in a certain direction."""
+        """Move the head of the snake in a certain direction.
+
+        Once a step moved every knot straight behind the one before it, the rope
+        lies straight along the run, and the remaining steps move all knots alike.
+        """
         direction, steps = instruction.split(" ")
-        steps = int(steps)
-
-        for _ in range(steps):
-            if direction == "L":
-                self.x -= 1
-            elif direction == "R":
-                self.x += 1
-            elif direction == "U":
-                self.y -= 1
-            else:
-                self.y += 1
+        step_y, step_x = DIRECTIONS[direction]
+        ys, xs, last = self._ys, self._xs, self.tail_length
+        remaining = int(steps)
 
-            previous_x = self.x
-            previous_y = self.y
+        if remaining:
+            self.visited.add(ys[last], xs[last])
 
-            for index in range(self.tail_length):
-                tail_y, tail_x = self.tail[index]
+        while remaining:
+            remaining -= 1
+            ys[0] += step_y
+            xs[0] += step_x
+            straight = True
 
-                if abs(previous_y - tail_y) == 2 or abs(previous_x - tail_x) == 2:
-                    tail_y += (
-                        1 if previous_y > tail_y else 0 if previous_y == tail_y else -1
-                    )
-                    tail_x += (
-                        1 if previous_x > tail_x else 0 if previous_x == tail_x else -1
-                    )
+            for index in range(1, last + 1):
+                delta_y = ys[index - 1] - ys[index]
+                delta_x = xs[index - 1] - xs[index]
+                if -1 <= delta_y <= 1 and -1 <= delta_x <= 1:
+                    break
+                if delta_y != 2 * step_y or delta_x != 2 * step_x:
+                    straight = False
 
-                self.tail[index] = [tail_y, tail_x]
-                previous_x, previous_y = tuple(self.tail[index])
+                ys[index] += (delta_y > 0) - (delta_y < 0)
+                xs[index] += (delta_x > 0) - (delta_x < 0)
+            else:
+                self.visited.add(ys[last], xs[last])
+                if straight and remaining:
+                    self._advance(step_y, step_x, remaining)
+                    remaining = 0
+
+    def _advance(self, step_y: int, step_x: int, count: int) -> None:
+        """Move a straight rope along its run in bulk."""
+        ys, xs, last = self._ys, self._xs, self.tail_length
+        self.visited.add_run(ys[last], xs[last], step_y, step_x, count)
 
-            self.visited.add((self.tail[-1][0], self.tail[-1][1]))
+        for index in range(last + 1):
+            ys[index] += count * step_y
+            xs[index] += count * step_x
 
     def unique_tail_positions(self) -> int:
         """Unique positions of the tail."""
         return len(self.visited)
 
 
-@click.command(name="day09")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 9."""
-    snake = Snake(1)
-    for instruction in path.read_text().splitlines():
-        snake.move(instruction)
-    print(f"[1] Tail positions: {snake.unique_tail_positions()}")
+def parse(data: str) -> list[str]:
+    """Parse input into a list of instructions."""
+    return data.splitlines()
 
-    snake = Snake(9)
-    for instruction in path.read_text().splitlines():
+
+def _unique_tail_positions(
+    instructions: list[str], tail_length: int, visited: str
+) -> int:
+    """Move a snake along all instructions and count the cells its tail visited."""
+    snake = Snake(tail_length, VISITED_STORES[visited]())
+    for instruction in instructions:
         snake.move(instruction)
-    print(f"[2] Tail position of the long end: {snake.unique_tail_positions()}")
+    return snake.unique_tail_positions()
+
+
+def part_one(instructions: list[str], visited: str = "set") -> int:
+    """Determine unique positions of a tail of length 1."""
+    return _unique_tail_positions(instructions, 1, visited)
+
+
+def part_two(instructions: list[str], visited: str = "set") -> int:
+    """Determine unique positions of the end of a tail of length 9."""
+    return _unique_tail_positions(instructions, 9, visited)
+
+
+def solve(data: str, visited: str = "set") -> Result:
+    """Solve both parts of day 9, keeping track of visited cells in a given store."""
+    return solve_parts(
+        "day09",
+        data,
+        parse,
+        partial(part_one, visited=visited),
+        partial(part_two, visited=visited),
+    )
+
+
+@solver_command(
+    name="day09",
+    solve=solve,
+    options=[
+        click.option(
+            "--visited",
+            type=click.Choice(list(VISITED_STORES)),
+            default="set",
+            help="How to keep track of visited cells.",
+        )
+    ],
+)
+def main(result: Result) -> list[str]:
+    """Solve day 9."""
+    return [
+        f"[1] Tail positions: {result.part_one}",
+        f"[2] Tail position of the long end: {result.part_two}",
+    ]
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
-from pathlib import Path
 
-import click
-import click_pathlib
 from pydantic import BaseModel
 
+from ..cli import solver_command
+from ..result import Result, solve_parts
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -77,14 +77,40 @@ def _parse_instruction(instruction: str) -> Instruction:
     )
 
 
-@click.command(name="day10")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 10."""
-    instructions = [_parse_instruction(l) for l in path.read_text().splitlines() if l]
+def parse(data: str) -> list[Instruction]:
+    """Parse input into a list of instructions."""
+    return [_parse_instruction(l) for l in data.splitlines() if l]
+
+
+def _run_program(instructions: list[Instruction]) -> Program:
+    """Process all instructions in a new program."""
     program = Program()
 
     for instruction in instructions:
         program.process(instruction)
-    print(f"[1] Signal strength: {program.signal_strength}")
-    print(f"[2] CRT output:\n{program.drawing_output}")
+    return program
+
+
+def part_one(instructions: list[Instruction]) -> int:
+    """Determine total signal strength."""
+    return _run_program(instructions).signal_strength
+
+
+def part_two(instructions: list[Instruction]) -> str:
+    """Determine output of the drawing on the screen."""
+    return _run_program(instructions).drawing_output
+
+
+def solve(data: str) -> Result:
+    """Solve both parts of day 10."""
+    return solve_parts("day10", data, parse, part_one, part_two)
+
+
+@solver_command(name="day10", solve=solve)
+def main(result: Result) -> list[str]:
+    """Solve day 10."""
+    return [
+        f"[1] Signal strength: {result.part_one}",
+        "[2] CRT output:",
+        *str(result.part_two).splitlines(),
+    ]
@@ -2,17 +2,13 @@
 # pylint: disable=no-name-in-module,no-self-argument,too-few-public-methods,invalid-name
 from __future__ import annotations
 
-import logging
 import operator
 from functools import reduce
-from pathlib import Path
 
-import click
-import click_pathlib
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from ..cli import solver_command
+from ..result import Result, solve_parts
 
 OPERATORS = {
     "+": operator.add,
@@ -65,6 +61,12 @@ class StealingAnimals(BaseModel):
     """A number of stealing animals."""
 
     monkeys: list[Monkey]
+    _summaries: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @property
+    def summaries(self) -> dict[str, str]:
+        """Result strings of finished simulations, by the part that ran them."""
+        return self._summaries
 
     @property
     def common_divisor(self) -> int:
@@ -114,24 +116,54 @@ def _parse_monkey(block: str, worry_divisor: int = 3) -> Monkey:
     )
 
 
-@click.command(name="day11")
-@click.option("--path", type=click_pathlib.Path(exists=True))
-def main(path: Path) -> None:
-    """Solve day 10."""
-    animals = StealingAnimals(
-        monkeys=[_parse_monkey(l) for l in path.read_text().split("\n\n") if l]
-    )
-    for _ in range(20):
-        animals.run_round()
-    print(animals.result_string())
-    print(f"[1] Most active product: {animals.most_active()}")
+def parse(data: str) -> StealingAnimals:
+    """Parse input into a group of monkeys."""
+    return StealingAnimals(monkeys=[_parse_monkey(l) for l in data.split("\n\n") if l])
 
-    del animals
 
-    animals = StealingAnimals(
-        monkeys=[_parse_monkey(l, 1) for l in path.read_text().split("\n\n") if l]
-    )
-    for _ in range(10_000):
-        animals.run_round()
-    print(animals.result_string())
-    print(f"[2] Most active product: {animals.most_active()}")
+def _monkey_business(
+    animals: StealingAnimals, part: str, rounds: int, worry_divisor: int
+) -> int:
+    """Run a number of rounds on a copy of the animals and summarise where they ended."""
+    finished = animals.copy(deep=True)
+    for monkey in finished.monkeys:
+        monkey.worry_divisor = worry_divisor
+
+    for _ in range(rounds):
+        finished.run_round()
+    animals.summaries[part] = finished.result_string()
+
+    return finished.most_active()
+
+
+def part_one(animals: StealingAnimals) -> int:
+    """Determine most active product after 20 rounds."""
+    return _monkey_business(animals, "part_one", rounds=20, worry_divisor=3)
+
+
+def part_two(animals: StealingAnimals) -> int:
+    """Determine most active product after 10,000 rounds without relief."""
+    return _monkey_business(animals, "part_two", rounds=10_000, worry_divisor=1)
+
+
+def _summaries(animals: StealingAnimals) -> dict[str, str]:
+    """Describe what each monkey inspected and holds at the end of both parts."""
+    return dict(animals.summaries)
+
+
+def solve(data: str) -> Result:
+    """Solve both parts of day 11."""
+    return solve_parts("day11", data, parse, part_one, part_two, _summaries)
+
+
+@solver_command(name="day11", solve=solve)
+def main(result: Result) -> list[str]:
+    """Solve day 11."""
+    lines: list[str] = []
+
+    for number, part in enumerate(("part_one", "part_two"), start=1):
+        if part in result.details:
+            lines.append(result.details[part])
+        lines.append(f"[{number}] Most active product: {getattr(result, part)}")
+
+    return lines
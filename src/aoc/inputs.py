@@ -0,0 +1,61 @@
+"""Read puzzle inputs."""
+import contextlib
+import mmap
+import os
+from enum import Enum, auto
+from pathlib import Path
+from typing import IO, Iterator
+
+MMAP_THRESHOLD = 1 << 20
+
+
+class InputMode(Enum):
+    """Ways in which a solver can receive its input."""
+
+    TEXT = auto()
+    LINES = auto()
+    BYTES = auto()
+    PATH = auto()
+
+
+def read_input(path: Path) -> str:
+    """Read an input file once, so both parts can share the same text.
+
+    Large files are memory-mapped and decoded straight from the mapping, which
+    avoids holding an intermediate copy of the raw bytes.
+    """
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < MMAP_THRESHOLD:
+            text = handle.read().decode("utf-8")
+        else:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                text = str(buffer, "utf-8")
+
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+@contextlib.contextmanager
+def read_buffer(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Read an input file as raw bytes, memory-mapping large files."""
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < MMAP_THRESHOLD:
+            yield handle.read()
+        else:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+
+@contextlib.contextmanager
+def open_input(path: Path, mode: InputMode) -> Iterator[str | IO[str] | bytes | Path]:
+    """Provide an input file in the way a solver expects it."""
+    match mode:
+        case InputMode.LINES:
+            with path.open(encoding="utf-8") as handle:
+                yield handle
+        case InputMode.BYTES:
+            with read_buffer(path) as buffer:
+                yield buffer
+        case InputMode.PATH:
+            yield path
+        case _:
+            yield read_input(path)
@@ -0,0 +1,62 @@
+"""Structured results of solvers."""
+# pylint: disable=no-name-in-module,too-few-public-methods
+import time
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+
+class Result(BaseModel):
+    """Answers to both parts of a day and the time spent on each phase."""
+
+    day: str
+    part_one: int | str
+    part_two: int | str
+    details: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    class Config:
+        """Keep answers of either type as they are."""
+
+        smart_union = True
+
+
+# pylint: disable=too-many-arguments
+def solve_parts(
+    day: str,
+    data: Any,
+    parse: Callable[[Any], Any],
+    part_one: Callable[[Any], int | str],
+    part_two: Callable[[Any], int | str],
+    details: Callable[[Any], dict[str, Any]] | None = None,
+) -> Result:
+    """Parse data once, solve both parts and time each of these phases.
+
+    Details are optional extra findings on the parsed data, such as the answers to
+    queries that were passed as options to a solver.
+    """
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    parsed = parse(data)
+    timings["parse"] = time.perf_counter() - start
+
+    answers: list[int | str] = []
+    for phase, part in (("part_one", part_one), ("part_two", part_two)):
+        start = time.perf_counter()
+        answers.append(part(parsed))
+        timings[phase] = time.perf_counter() - start
+
+    extra: dict[str, Any] = {}
+    if details:
+        start = time.perf_counter()
+        extra = details(parsed)
+        timings["details"] = time.perf_counter() - start
+
+    return Result(
+        day=day,
+        part_one=answers[0],
+        part_two=answers[1],
+        details=extra,
+        timings=timings,
+    )
@@ -0,0 +1,27 @@
+"""Run solvers outside of their own click command."""
+import time
+from pathlib import Path
+
+from .cli import format_result, solve_file
+
+
+def run_solver(
+    day: str, path: Path, no_cache: bool = False
+) -> tuple[str, list[str], float]:
+    """Run the solver of a single day, formatting its answers and wall time."""
+    start = time.perf_counter()
+    result = solve_file(day, path, no_cache=no_cache)
+
+    return day, format_result(result), time.perf_counter() - start
+
+
+def find_inputs(days: list[str], directory: Path) -> dict[str, Path]:
+    """Find an input file for each day within a directory, e.g. day01.txt."""
+    inputs: dict[str, Path] = {}
+
+    for day in days:
+        candidates = sorted(p for p in directory.glob(f"{day}*") if p.is_file())
+        if candidates:
+            inputs[day] = candidates[0]
+
+    return inputs
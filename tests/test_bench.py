@@ -0,0 +1,38 @@
+"""Tests for benchmarking solvers."""
+import pytest
+
+from aoc.bench import _percentile, compare
+
+
+@pytest.mark.parametrize(
+    ("samples", "fraction", "expected"),
+    [
+        ([5.0, 1.0, 4.0, 2.0, 3.0], 0.5, 3.0),
+        ([float(sample) for sample in range(1, 21)], 0.95, 19.0),
+        ([float(sample) for sample in range(1, 11)], 0.95, 10.0),
+        ([2.0, 1.0], 0.0, 1.0),
+        ([1.0], 0.95, 1.0),
+    ],
+)
+def test_percentile_uses_the_nearest_rank(
+    samples: list[float], fraction: float, expected: float
+):
+    """The percentile is the smallest sample with at least that fraction below it."""
+    assert _percentile(samples, fraction) == expected
+
+
+def test_compare_reports_medians_beyond_the_tolerance():
+    """Only phases that are slower than the baseline plus tolerance regress."""
+    baseline = {"day01": {"parse": {"median": 1.0}, "part_one": {"median": 1.0}}}
+    results = {
+        "day01": {
+            "parse": {"median": 1.05},
+            "part_one": {"median": 1.2},
+            "part_two": {"median": 9.0},
+        },
+        "day02": {"parse": {"median": 9.0}},
+    }
+
+    assert compare(results, baseline, tolerance=0.1) == [
+        "day01 part_one: median 1.200000s vs. baseline 1.000000s"
+    ]
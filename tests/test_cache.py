@@ -0,0 +1,38 @@
+"""Tests for the on-disk cache of solver results."""
+import os
+from pathlib import Path
+
+from aoc.cache import ResultCache
+
+
+def test_get_misses_unknown_keys(tmp_path: Path):
+    """A key that was never stored is not found."""
+    assert ResultCache(tmp_path / "cache").get("day01-unknown") is None
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path: Path):
+    """Entries that were read recently survive eviction of older ones."""
+    cache = ResultCache(tmp_path, max_size=10)
+    cache.put("first", "1111")
+    cache.put("second", "2222")
+    os.utime(tmp_path / "first", (1, 1))
+    os.utime(tmp_path / "second", (2, 2))
+
+    assert cache.get("first") == "1111"
+    cache.put("third", "3333")
+
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["first", "third"]
+    assert cache.get("second") is None
+
+
+def test_put_leaves_temporary_files_alone(tmp_path: Path):
+    """Files that other processes are still writing are never evicted."""
+    in_flight = tmp_path / "other.tmp"
+    in_flight.write_text("x" * 100, encoding="utf-8")
+    os.utime(in_flight, (1, 1))
+
+    cache = ResultCache(tmp_path, max_size=10)
+    cache.put("first", "1111")
+
+    assert in_flight.exists()
+    assert cache.get("first") == "1111"
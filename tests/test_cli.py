@@ -0,0 +1,35 @@
+"""Tests for the shared command line helpers."""
+from pathlib import Path
+
+import click
+import pytest
+
+from aoc.cli import expand_paths
+
+
+def test_expands_files_directories_and_globs(tmp_path: Path):
+    """Files are kept, directories and globs expand to the files within, sorted."""
+    for name in ("b.txt", "a.txt", "c.log"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    (tmp_path / "nested.txt").mkdir()
+
+    assert expand_paths((str(tmp_path / "c.log"), str(tmp_path / "*.txt"))) == [
+        tmp_path / "c.log",
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+    ]
+    assert expand_paths((str(tmp_path),)) == [
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+        tmp_path / "c.log",
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["empty", "*.txt", "missing.txt"])
+def test_rejects_patterns_without_files(tmp_path: Path, pattern: str):
+    """Empty directories and globs that match only directories are no inputs."""
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "only.txt").mkdir()
+
+    with pytest.raises(click.BadParameter):
+        expand_paths((str(tmp_path / pattern),))
@@ -0,0 +1,21 @@
+"""Tests for day 1 of Advent of Code."""
+from aoc.day01.solve import parse, solve
+
+EXAMPLE = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000\n"
+
+
+def test_solves_the_example():
+    """The example yields the calories from the puzzle description."""
+    result = solve(EXAMPLE)
+    assert (result.part_one, result.part_two) == (24000, 45000)
+
+
+def test_keeps_only_the_top_totals():
+    """Only the highest totals are kept, highest first."""
+    assert parse(EXAMPLE.splitlines(), top=2) == [24000, 11000]
+
+
+def test_empty_input_has_no_calories():
+    """Input without any elves yields zero for both parts."""
+    result = solve("\n\n")
+    assert (result.part_one, result.part_two) == (0, 0)
@@ -0,0 +1,25 @@
+"""Tests for day 2 of Advent of Code."""
+import pytest
+
+from aoc.day02 import solve as day02
+
+EXAMPLE = "A Y\nB X\nC Z\n"
+
+
+def test_solves_the_example():
+    """The example yields the points from the puzzle description."""
+    result = day02.solve(EXAMPLE)
+    assert (result.part_one, result.part_two) == (15, 12)
+
+
+@pytest.mark.parametrize("chunk_size", [4, 5, 1 << 24])
+def test_counts_rounds_across_chunks(monkeypatch: pytest.MonkeyPatch, chunk_size: int):
+    """Chunks end after a line break, so that no round is split in two."""
+    monkeypatch.setattr(day02, "CHUNK_SIZE", chunk_size)
+    assert day02.parse(EXAMPLE * 3).tolist() == [0, 3, 0, 3, 0, 0, 0, 0, 3]
+
+
+def test_rejects_rounds_without_a_choice():
+    """A round needs both an opponent and a choice."""
+    with pytest.raises(ValueError):
+        day02.parse(b"A Y\nB\n")
@@ -0,0 +1,32 @@
+"""Tests for day 3 of Advent of Code."""
+from aoc.day03.solve import parse, solve
+
+EXAMPLE = """vJrwpWtwJgWrhcsFMMfFFhFp
+jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
+PmmdzqPrVvPwwTWBwg
+wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
+ttgJtRGJQctTZtZT
+CrZsJsPPZsGzwwsLwLmpwMDw
+"""
+
+
+def test_solves_the_example():
+    """The example yields the priorities from the puzzle description."""
+    result = solve(EXAMPLE)
+    assert (result.part_one, result.part_two) == (157, 70)
+
+
+def test_shared_item_is_counted_once_per_rucksack():
+    """An item that occurs several times in both compartments counts only once."""
+    assert parse(["aaBa", "aAaa"])[0] == 2
+
+
+def test_badge_is_shared_by_all_elves_of_a_group():
+    """Items shared by only two elves of a group are not its badge."""
+    assert parse(["xyZz", "xZ", "yZ"])[1] == 52
+    assert parse(["xyZz", "xZ", "yZ", "ab"])[1] == 52
+
+
+def test_skips_blank_lines():
+    """Blank lines neither count as rucksacks nor as members of a group."""
+    assert parse(["", "abZb", "", "cZ", "dZ", ""]) == (2, 52)
@@ -0,0 +1,76 @@
+"""Tests for day 4 of Advent of Code."""
+import click
+import numpy as np
+import pytest
+
+from aoc.day04.solve import AssignmentIndex, _section_range, parse, solve
+
+
+@pytest.mark.parametrize(
+    ("assignments", "expected"),
+    [
+        ([[1, 5], [6, 8]], (1, 1, 8)),
+        ([[1, 5], [3, 5], [6, 8], [6, 7]], (2, 3, 7)),
+    ],
+)
+def test_max_coverage_spans_touching_assignments(
+    assignments: list[list[int]], expected: tuple[int, int, int]
+):
+    """Assignments that end where others start do not cut the range short."""
+    assert AssignmentIndex(np.array(assignments)).max_coverage() == expected
+
+
+EXAMPLE = "2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8\n"
+
+
+@pytest.fixture(name="index")
+def fixture_index() -> AssignmentIndex:
+    """Index over all assignments of the example."""
+    return AssignmentIndex(parse(EXAMPLE).reshape(-1, 2))
+
+
+def test_solves_the_example():
+    """The example yields the pairs from the puzzle description."""
+    result = solve(EXAMPLE, overlapping=(7, 7), coverage=6, max_coverage=True)
+    assert (result.part_one, result.part_two) == (2, 4)
+    assert result.details == {
+        "pairs": 6,
+        "overlapping": [[2, 8], [3, 7], [4, 8], [5, 7], [6, 8], [7, 9]],
+        "coverage": 8,
+        "max_coverage": (8, 6, 6),
+    }
+
+
+@pytest.mark.parametrize(
+    ("section", "elves"), [(1, 0), (2, 4), (3, 5), (6, 8), (7, 6), (9, 1), (10, 0)]
+)
+def test_coverage_counts_assignments_containing_a_section(
+    index: AssignmentIndex, section: int, elves: int
+):
+    """Assignments that start or end at a section cover it as well."""
+    assert index.coverage(section) == elves
+
+
+def test_overlapping_includes_assignments_that_touch_the_range():
+    """Assignments overlap when they share a single section, not when adjacent."""
+    index = AssignmentIndex(np.array([[6, 9], [1, 4], [5, 6], [4, 5], [1, 3]]))
+
+    assert index.overlapping(5, 5).tolist() == [[4, 5], [5, 6]]
+    assert index.overlapping(4, 6).tolist() == [[1, 4], [4, 5], [5, 6], [6, 9]]
+    assert index.overlapping(10, 12).tolist() == []
+
+
+def test_empty_index_has_no_coverage():
+    """Without assignments, nothing overlaps and nothing is covered."""
+    index = AssignmentIndex(np.empty((0, 2), dtype=np.int64))
+
+    assert index.overlapping(1, 9).tolist() == []
+    assert index.coverage(1) == 0
+    assert index.max_coverage() == (0, 0, 0)
+
+
+@pytest.mark.parametrize("value", ["4-2", "2", "a-b"])
+def test_section_range_rejects_invalid_ranges(value: str):
+    """Ranges that are malformed or end before they start are bad options."""
+    with pytest.raises(click.BadParameter):
+        _section_range(None, None, value)
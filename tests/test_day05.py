@@ -0,0 +1,37 @@
+"""Tests for day 5 of Advent of Code."""
+import pytest
+
+from aoc.day05.solve import parse, solve
+
+EXAMPLE = """    [D]    
+[N] [C]    
+[Z] [M] [P]
+ 1   2   3 
+
+move 1 from 2 to 1
+move 3 from 1 to 3
+move 2 from 2 to 1
+move 1 from 1 to 2
+"""
+
+
+def test_solves_the_example():
+    """The example yields the top crates from the puzzle description."""
+    result = solve(EXAMPLE)
+    assert (result.part_one, result.part_two) == ("CMZ", "MCD")
+
+
+def test_parses_moves_into_zero_based_stacks():
+    """Moves become rows of crate counts and zero-based stack indices."""
+    _, moves = parse(EXAMPLE)
+    assert moves.tolist() == [[1, 1, 0], [3, 0, 2], [2, 1, 0], [1, 0, 1]]
+
+
+@pytest.mark.parametrize("multiple", [False, True])
+def test_move_rejects_more_crates_than_a_stack_holds(multiple: bool):
+    """Moving more crates than there are leaves the stacks untouched and fails."""
+    structure, _ = parse(EXAMPLE)
+
+    with pytest.raises(IndexError):
+        structure.move(3, 0, 1, multiple)
+    assert structure.top_crates == "NDP"
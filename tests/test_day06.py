@@ -0,0 +1,71 @@
+"""Tests for day 6 of Advent of Code."""
+from pathlib import Path
+
+import pytest
+
+from aoc.day06.solve import find_markers, find_markers_parallel, solve
+
+
+EXAMPLES = [
+    ("mjqjpqmgbljsphdztnvjfqwrcgnmlb", 7, 19),
+    ("bvwbjplbgvbhsrlpgdmjqwftvncz", 5, 23),
+    ("nppdvjthqldpwncqszvftbrmjlhg", 6, 23),
+    ("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 10, 29),
+    ("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 11, 26),
+]
+
+
+@pytest.mark.parametrize(("message", "packet", "start"), EXAMPLES)
+def test_solves_the_examples(message: str, packet: int, start: int):
+    """The examples yield the markers from the puzzle description."""
+    result = solve(message)
+    assert (result.part_one, result.part_two) == (packet, start)
+
+
+def test_finds_markers_across_chunks():
+    """A run of distinct signals carries over from one chunk to the next."""
+    assert find_markers(["mjqj", "pqmgb", "ljsphdztnvjfqwrcgnmlb"], [4, 14]) == {
+        4: 7,
+        14: 19,
+    }
+
+
+def test_finds_markers_of_other_window_sizes():
+    """Markers of extra window sizes are reported, and 0 when there is none."""
+    result = solve("aabcaabcde", windows=(3, 6))
+    assert result.details == {"markers": {3: 4, 6: 0}}
+
+
+@pytest.mark.parametrize(
+    ("message", "find_all", "expected"),
+    [
+        ("aaabcdaa", False, {2: [4], 4: [6], 6: []}),
+        ("aaabcdaa", True, {2: [4, 5, 6, 7], 4: [6, 7], 6: []}),
+        ("xxabcdefxx", False, {2: [3], 4: [5], 6: [7]}),
+        (
+            "xxabcdefxx",
+            True,
+            {2: [3, 4, 5, 6, 7, 8, 9], 4: [5, 6, 7, 8, 9], 6: [7, 8, 9]},
+        ),
+    ],
+)
+def test_parallel_search_finds_markers_spanning_chunks_once(
+    tmp_path: Path, message: str, find_all: bool, expected: dict[int, list[int]]
+):
+    """Markers that span the border of two chunks, or several, are found once."""
+    path = tmp_path / "signal.txt"
+    path.write_text(message, encoding="utf-8")
+
+    markers = find_markers_parallel(
+        path, (2, 4, 6), processes=2, find_all=find_all, chunk_size=4
+    )
+
+    assert markers == expected
+
+
+def test_parallel_search_of_an_empty_file_finds_nothing(tmp_path: Path):
+    """An empty file has no markers of any window size."""
+    path = tmp_path / "signal.txt"
+    path.write_bytes(b"")
+
+    assert find_markers_parallel(path, (4, 14), processes=2) == {4: [], 14: []}
@@ -0,0 +1,119 @@
+"""Tests for day 7 of Advent of Code."""
+import io
+
+import pytest
+
+from aoc.day07.solve import MAX_SIZE, FilesystemIndex, solve
+
+EXAMPLE = """$ cd /
+$ ls
+dir a
+14848514 b.txt
+8504156 c.dat
+dir d
+$ cd a
+$ ls
+dir e
+29116 f
+2557 g
+62596 h.lst
+$ cd e
+$ ls
+584 i
+$ cd ..
+$ cd ..
+$ cd d
+$ ls
+4060174 j
+8033020 d.log
+5626152 d.ext
+7214296 k
+"""
+
+
+EXAMPLE_SIZES = {"/": 48381165, "/a": 94853, "/a/e": 584, "/d": 24933642}
+
+
+def test_index_sizes_directories_by_full_path():
+    """Sizes are found by path and in order of size."""
+    index = FilesystemIndex(EXAMPLE.splitlines())
+
+    assert index.sizes == EXAMPLE_SIZES
+    assert (index.size(), index.size("/a/"), index.size("/a/e")) == (
+        48381165,
+        94853,
+        584,
+    )
+    assert index.largest(2) == [("/", 48381165), ("/d", 24933642)]
+    assert index.below(MAX_SIZE) == [("/a/e", 584), ("/a", 94853)]
+    assert index.at_least(24933642) == [("/d", 24933642), ("/", 48381165)]
+
+
+@pytest.mark.parametrize("merge_ratio", [0, 1 << 30])
+def test_index_follows_a_growing_log(monkeypatch: pytest.MonkeyPatch, merge_ratio: int):
+    """Lines appended to the log update sizes, whether merged or moved one by one."""
+    monkeypatch.setattr(FilesystemIndex, "MERGE_RATIO", merge_ratio)
+    lines = EXAMPLE.splitlines()
+    index = FilesystemIndex(lines[:12])
+
+    assert index.sizes == {"/": 23446939, "/a": 94269, "/a/e": 0, "/d": 0}
+    assert index.below(MAX_SIZE) == [("/a/e", 0), ("/d", 0), ("/a", 94269)]
+
+    index.feed(lines[12:])
+
+    assert index.sizes == EXAMPLE_SIZES
+    assert index.largest(5) == sorted(
+        EXAMPLE_SIZES.items(), key=lambda item: item[1], reverse=True
+    )
+
+
+def test_index_keeps_directories_with_the_same_name_apart():
+    """Directories are told apart by their full path rather than by their name."""
+    index = FilesystemIndex(
+        ["$ cd /", "$ ls", "dir a", "dir b", "$ cd a", "$ ls", "dir x"]
+        + ["$ cd x", "$ ls", "1 f", "$ cd /", "$ cd b", "$ ls", "dir x", "$ cd x"]
+        + ["$ ls", "2 f"]
+    )
+
+    assert (index.size("/a/x"), index.size("/b/x"), index.size()) == (1, 2, 3)
+
+
+def test_index_replaces_the_size_of_a_listed_file():
+    """A file that is listed again with another size only counts with its new size."""
+    index = FilesystemIndex(["$ cd /", "$ ls", "100 f"])
+    index.feed(["$ ls", "300 f"])
+
+    assert index.size() == 300
+    assert index.at_least(0) == [("/", 300)]
+
+
+def test_streams_lines_of_the_example():
+    """The log can be passed as a stream of lines, as the command reads it."""
+    result = solve(io.StringIO(EXAMPLE))
+
+    assert result.part_one == 95437
+    assert result.part_two == 24933642
+    assert result.details == {"directory": "d", "required_delete": 8381165}
+
+
+def test_revisited_directories_are_counted_once():
+    """Entering and listing a directory again does not add its files twice."""
+    log = "\n".join(
+        [
+            "$ cd /",
+            "$ ls",
+            "dir a",
+            "10 x",
+            "$ cd a",
+            "$ ls",
+            "50000 y",
+            "$ cd ..",
+            "$ cd a",
+            "$ ls",
+            "50000 y",
+        ]
+    )
+
+    result = solve(log)
+
+    assert result.part_one == 50000 + 50010
@@ -0,0 +1,95 @@
+"""Tests for day 8 of Advent of Code."""
+import pytest
+
+from aoc.day08.solve import (
+    Forest,
+    determine_tree_scores,
+    determine_visibility,
+    parse,
+    solve,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"12345\n1234\n12345\n", b"1234\n12345\n", b"12\n34\r\n56\n", b"123\n4x6\n"],
+)
+def test_parse_rejects_malformed_grids(data: bytes):
+    """Ragged rows and other characters than digits are not a grid of trees."""
+    with pytest.raises(ValueError):
+        parse(data)
+
+
+def test_parse_accepts_windows_line_endings():
+    """Rows may end in CRLF, with or without a final line break."""
+    assert parse(b"12\r\n34\r\n").tolist() == [[1, 2], [3, 4]]
+    assert parse(b"12\r\n34").tolist() == [[1, 2], [3, 4]]
+
+
+EXAMPLE = b"30373\n25512\n65332\n33549\n35390\n"
+
+
+def test_solves_the_example():
+    """The example yields the trees from the puzzle description."""
+    result = solve(EXAMPLE)
+    assert (result.part_one, result.part_two) == (21, 8)
+
+
+def test_visibility_of_the_example():
+    """Edge trees are visible, inner trees only when taller than a whole line."""
+    assert determine_visibility(parse(EXAMPLE)).astype(int).tolist() == [
+        [1, 1, 1, 1, 1],
+        [1, 1, 1, 0, 1],
+        [1, 1, 0, 1, 1],
+        [1, 0, 1, 0, 1],
+        [1, 1, 1, 1, 1],
+    ]
+
+
+def test_tree_scores_of_the_example():
+    """Viewing distances stop at the first tree at least as tall, or at the edge."""
+    assert determine_tree_scores(parse(EXAMPLE)).tolist() == [
+        [0, 0, 0, 0, 0],
+        [0, 1, 4, 1, 0],
+        [0, 6, 1, 2, 0],
+        [0, 1, 8, 3, 0],
+        [0, 0, 0, 0, 0],
+    ]
+
+
+def test_single_row_of_trees_is_visible_without_scores():
+    """A grid of one row consists of edge trees only."""
+    trees = parse(b"12321\n")
+    assert determine_visibility(trees).all()
+    assert not determine_tree_scores(trees).any()
+
+
+def test_forest_counts_a_raised_tree():
+    """A towering tree is visible with a high score, and hides the tree next to it."""
+    forest = Forest(parse(EXAMPLE))
+    forest.update([(2, 2, 9)])
+
+    assert (forest.visible_count, forest.max_score) == (21, 16)
+    assert forest.visibility()[2].tolist() == [True, False, True, True, True]
+    assert forest.tree_scores()[1:4, 1:4].tolist() == [[1, 2, 1], [2, 16, 2], [1, 4, 3]]
+
+    forest.update([(2, 2, 3)])
+    assert (forest.visible_count, forest.max_score) == (21, 8)
+
+
+def test_forest_rescores_after_lowering_the_best_tree():
+    """Lowering the best tree opens up the view of its neighbours."""
+    forest = Forest(parse(EXAMPLE))
+    forest.update([(3, 2, 0)])
+
+    assert (forest.visible_count, forest.max_score) == (21, 9)
+    assert forest.visibility()[3].tolist() == [True, False, False, True, True]
+    assert forest.tree_scores()[1:4, 1:4].tolist() == [[1, 6, 1], [6, 2, 2], [2, 1, 9]]
+
+
+def test_forest_without_updates_keeps_its_totals():
+    """An empty batch of updates changes nothing."""
+    forest = Forest(parse(EXAMPLE))
+    forest.update([])
+
+    assert (forest.visible_count, forest.max_score) == (21, 8)
@@ -0,0 +1,116 @@
+"""Tests for day 9 of Advent of Code."""
+import pytest
+
+from aoc.day09.solve import (
+    VISITED_STORES,
+    BitmapVisited,
+    PackedVisited,
+    SetVisited,
+    Snake,
+    solve,
+)
+
+EXAMPLE = "R 4\nU 4\nL 3\nD 1\nR 4\nD 1\nL 5\nR 2\n"
+LARGER_EXAMPLE = "R 5\nU 8\nL 8\nD 3\nR 17\nD 10\nL 25\nU 20\n"
+
+
+class RecordingVisited(SetVisited):
+    """Visited cells that also remember which runs were added in bulk."""
+
+    def __init__(self):
+        """Initialize without visited cells or runs."""
+        super().__init__()
+        self.runs: list[tuple[int, int, int, int, int]] = []
+
+    def add_run(self, y: int, x: int, step_y: int, step_x: int, count: int) -> None:
+        """Remember a run and mark its cells as visited."""
+        self.runs.append((y, x, step_y, step_x, count))
+        super().add_run(y, x, step_y, step_x, count)
+
+
+@pytest.mark.parametrize("store", sorted(VISITED_STORES))
+def test_solves_the_examples(store: str):
+    """Both examples yield the tail positions from the puzzle description."""
+    result = solve(EXAMPLE, store)
+    assert (result.part_one, result.part_two) == (13, 1)
+    assert solve(LARGER_EXAMPLE, store).part_two == 36
+
+
+def test_straight_rope_moves_along_a_run_in_bulk():
+    """Once the rope is straight, the rest of the run is added at once."""
+    visited = RecordingVisited()
+    snake = Snake(9, visited)
+    snake.move("R 1000")
+
+    assert visited.runs == [(0, 1, 0, 1, 990)]
+    assert [[snake.y, snake.x], *snake.tail] == [[0, 1000 - i] for i in range(10)]
+    assert snake.unique_tail_positions() == 992
+
+
+def test_rope_straightens_again_after_a_turn():
+    """A turn is followed step by step until the tail is straight behind the head."""
+    visited = RecordingVisited()
+    snake = Snake(1, visited)
+    snake.move("R 10")
+    snake.move("U 10")
+
+    assert visited.runs == [(0, 1, 0, 1, 8), (-2, 10, -1, 0, 7)]
+    assert [[snake.y, snake.x], *snake.tail] == [[-10, 10], [-9, 10]]
+    assert snake.unique_tail_positions() == 19
+
+
+def test_moving_zero_steps_visits_nothing():
+    """An instruction without steps neither moves the rope nor visits a cell."""
+    snake = Snake(2, RecordingVisited())
+    snake.move("R 0")
+
+    assert snake.tail == [[0, 0], [0, 0]]
+    assert snake.unique_tail_positions() == 0
+
+
+@pytest.mark.parametrize("store", sorted(VISITED_STORES))
+def test_store_counts_cells_once(store: str):
+    """Cells that are added again, alone or within runs, are counted once."""
+    visited = VISITED_STORES[store]()
+    visited.add(0, 0)
+    visited.add(0, 0)
+    visited.add_run(0, 0, 0, 1, 3)
+    visited.add_run(0, 4, 0, -1, 3)
+    visited.add_run(0, 4, 1, 0, 0)
+
+    assert len(visited) == 4
+
+
+@pytest.mark.parametrize("store", sorted(VISITED_STORES))
+def test_store_keeps_far_cells_in_every_direction_apart(store: str):
+    """Negative and distant coordinates neither collide nor get lost."""
+    cells = [(0, -1), (-1, 0), (-1, -1), (-1000, -3), (1000, 5), (3, -1000), (-3, 999)]
+    visited = VISITED_STORES[store]()
+    for y, x in cells:
+        visited.add(y, x)
+    visited.add_run(-1000, -3, 0, 1, 2)
+
+    assert len(visited) == len(cells) + 2
+
+
+def test_packed_store_merges_runs_through_a_fixed_batch(monkeypatch):
+    """Runs longer than the batch are merged piecewise without growing the batch."""
+    monkeypatch.setattr(PackedVisited, "BATCH_SIZE", 4)
+    visited = PackedVisited()
+    visited.add_run(0, 0, 0, 1, 10)
+    visited.add_run(0, 5, 0, 1, 10)
+    visited.add(0, 3)
+
+    assert len(visited) == 15
+    assert len(visited._batch) == 4  # pylint: disable=protected-access
+
+
+def test_bitmap_store_packs_eight_cells_into_a_byte():
+    """Runs across the whole bitmap set one bit per cell without growing it."""
+    visited = BitmapVisited(size=64)
+    visited.add(-32, -32)
+    visited.add_run(-32, -32, 1, 0, 63)
+    visited.add_run(0, -32, 0, 1, 63)
+
+    assert len(visited) == 127
+    assert visited._bits.nbytes == 64 * 64 // 8  # pylint: disable=protected-access